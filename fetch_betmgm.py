@@ -1,7 +1,23 @@
 from playwright.sync_api import sync_playwright
-import time
 import os
 
+# The debug flow saves a screenshot and HTML dump, so visual assets must
+# load; third-party trackers are dead weight and get aborted by a URL glob
+# that the driver matches itself — no Python callback per request.
+_BLOCKED_HOST_GLOB = "**{googletagmanager,google-analytics,doubleclick,segment.io,optimizely,newrelic}**"
+
+def _launch_browser(p, **launch_kwargs):
+    """
+    Connects to a long-lived browser server when PLAYWRIGHT_WS_ENDPOINT is
+    set (start one with `playwright launch-server --browser chromium`), so
+    scheduled runs skip the ~2s Chromium startup; otherwise launches fresh.
+    Closing the returned browser only disconnects when connected.
+    """
+    ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+    if ws_endpoint:
+        return p.chromium.connect(ws_endpoint)
+    return p.chromium.launch(**launch_kwargs)
+
 def scrape_betmgm_structure():
     # URL - Try Canada (Ontario) which might be the user's region and have different protection
     url = "https://sports.betmgm.ca/en/sports"
@@ -9,13 +25,15 @@ def scrape_betmgm_structure():
     os.makedirs("betmgm_data", exist_ok=True)
     
     with sync_playwright() as p:
-        # Launch options
-        browser = p.chromium.launch(
-            headless=False,
-            channel="chrome", 
+        # Launch options - headless bundled Chromium: no compositor/GPU work,
+        # a fraction of the RAM of headed Chrome. "new" headless plus the
+        # stealth flags/init script below keeps the fingerprint close to headful.
+        browser = _launch_browser(
+            p,
+            headless=True,
             args=[
                 "--disable-blink-features=AutomationControlled",
-                "--start-maximized"
+                "--headless=new"
             ]
         )
         
@@ -25,22 +43,25 @@ def scrape_betmgm_structure():
         )
         
         context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+        context.route(_BLOCKED_HOST_GLOB, lambda route: route.abort())
+
         page = context.new_page()
         
         print(f"Navigating to {url}...")
         try:
             page.goto(url, timeout=60000, wait_until="domcontentloaded")
             
-            # Wait and Interact
-            print("Page loaded. Sleeping 5s before interaction...")
-            time.sleep(5)
+            # Wait for the network to settle instead of a blind 5s sleep;
+            # returns as soon as the page is actually quiet.
+            try:
+                page.wait_for_load_state("networkidle", timeout=10000)
+            except Exception:
+                pass  # Busy pages never go fully idle; proceed anyway
             
             # Simulate mouse movement
             page.mouse.move(100, 100)
             page.mouse.down()
             page.mouse.up()
-            time.sleep(2)
             page.mouse.move(200, 200)
             
             # Check for title again
@@ -51,19 +72,25 @@ def scrape_betmgm_structure():
                 # Look for "NBA" or "Basketball"
                 page.click("text=NBA", timeout=5000)
                 print("Clicked NBA!")
-                time.sleep(5)
+                # Wait for the post-click content instead of a fixed 5s
+                try:
+                    page.wait_for_load_state("networkidle", timeout=5000)
+                except Exception:
+                    pass
             except:
                 print("Could not click NBA link.")
 
-            # Save HTML for inspection
-            content = page.content()
-            with open("betmgm_data/page_dump.html", "w", encoding="utf-8") as f:
-                f.write(content)
-            print("Saved HTML dump to betmgm_data/page_dump.html")
-            
-            # Save screenshot
-            page.screenshot(path="betmgm_data/page_view.png")
-            print("Saved screenshot to betmgm_data/page_view.png")
+            # Diagnostic artifacts only: page.content() serializes the full
+            # DOM over IPC and the screenshot rasterizes the whole viewport,
+            # several MB of work per run — opt in via BETMGM_DEBUG=1.
+            if os.environ.get("BETMGM_DEBUG"):
+                content = page.content()
+                with open("betmgm_data/page_dump.html", "w", encoding="utf-8") as f:
+                    f.write(content)
+                print("Saved HTML dump to betmgm_data/page_dump.html")
+
+                page.screenshot(path="betmgm_data/page_view.png")
+                print("Saved screenshot to betmgm_data/page_view.png")
             
         except Exception as e:
             print(f"Error: {e}")
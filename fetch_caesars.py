@@ -2,8 +2,109 @@ import csv
 import json
 import time
 import os
+from datetime import datetime
+
+import httpx
 from playwright.sync_api import sync_playwright
 
+# The web app itself reads odds from this JSON schedule endpoint; hitting it
+# directly skips the browser, the CAPTCHA dance and the DOM scraping.
+CAESARS_API_URL = (
+    "https://api.americanwagering.com/regions/us/locations/dc/brands/czr/sb"
+    "/v3/sports/basketball/events/schedule"
+)
+OUTPUT_CSV = "caesars_data/caesars_nba_odds.csv"
+_API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+}
+
+def _strip_pipes(name):
+    # Caesars wraps display names in pipes, e.g. '|Boston Celtics|'
+    return (name or "").replace("|", "").strip()
+
+def fetch_caesars_nba_api():
+    """
+    Fetches NBA moneylines straight from the Caesars schedule API and writes
+    the standard odds CSV. Returns True on success so the caller can fall
+    back to the browser flow when the endpoint misbehaves.
+    """
+    os.makedirs("caesars_data", exist_ok=True)
+    print(f"Fetching Caesars schedule API: {CAESARS_API_URL}")
+
+    try:
+        resp = httpx.get(CAESARS_API_URL, headers=_API_HEADERS, params={"competitionIds": ""}, timeout=30)
+        resp.raise_for_status()
+        payload = resp.json()
+    except Exception as e:
+        print(f"Caesars API fetch failed: {e}")
+        return False
+
+    fetch_time = datetime.now().isoformat()
+    rows = []
+
+    for competition in payload.get("competitions", []):
+        comp_name = _strip_pipes(competition.get("name"))
+        if "NBA" not in comp_name.upper():
+            continue
+        for event in competition.get("events", []):
+            if event.get("type") and event["type"] != "MATCH":
+                continue
+            event_name = _strip_pipes(event.get("name"))
+            if " at " not in event_name:
+                continue
+            away_team, home_team = (part.strip() for part in event_name.split(" at ", 1))
+
+            home_odds = away_odds = None
+            for market in event.get("markets", []):
+                market_name = _strip_pipes(market.get("displayName") or market.get("name"))
+                if market_name not in ("Money Line", "Moneyline"):
+                    continue
+                for selection in market.get("selections", []):
+                    team = _strip_pipes(selection.get("name"))
+                    price = (selection.get("price") or {}).get("a")
+                    if price is None:
+                        continue
+                    if team == home_team:
+                        home_odds = price
+                    elif team == away_team:
+                        away_odds = price
+                break
+
+            if home_odds is None or away_odds is None:
+                continue
+
+            rows.append({
+                "Sport": "NBA",
+                "Game_Date": event.get("startTime", ""),
+                "Event": f"{away_team} vs {home_team}",
+                "BetType": "Moneyline",
+                "HomeTeam": home_team,
+                "HomeOdds": home_odds,
+                "AwayTeam": away_team,
+                "AwayOdds": away_odds,
+                "Is_Live": bool(event.get("started", False)),
+                "Fetched_At": fetch_time,
+                "Url": f"https://sportsbook.caesars.com/us/dc/bet/basketball/events/{event.get('id', '')}",
+            })
+
+    if not rows:
+        print("Caesars API returned no NBA moneyline events.")
+        return False
+
+    keys = ["Sport", "Game_Date", "Event", "BetType", "HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds", "Is_Live", "Fetched_At", "Url"]
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(keys)
+        writer.writerows(tuple(r[k] for k in keys) for r in rows)
+    print(f"Saved {len(rows)} Caesars games to {OUTPUT_CSV}")
+    return True
+
+# A human drives this page through CAPTCHAs, so images/CSS must render;
+# analytics and trackers are aborted via a driver-side URL glob, keeping
+# the page responsive without routing every request through Python.
+_BLOCKED_HOST_GLOB = "**{googletagmanager,google-analytics,doubleclick,segment.io,optimizely,newrelic}**"
+
 def fetch_caesars_nba():
     # Ensure output directory exists
     output_dir = "caesars_data"
@@ -24,6 +125,7 @@ def fetch_caesars_nba():
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         
+        context.route(_BLOCKED_HOST_GLOB, lambda route: route.abort())
         page = context.pages[0] if context.pages else context.new_page()
         
         # Navigate
@@ -74,57 +176,40 @@ def fetch_caesars_nba():
         
         try:
             # Finding all 'game rows'
-            # Assuming standard structure where a row contains Team names and Odds buttons
-            # We will use a loose heurstic: Divs that contain "Spread" and "Total" might be headers,
-            # but the game rows will be siblings or children of a list.
-            
-            # Let's try to find date headers first, then games under them?
-            # Or just flat list of games.
-            
-            # Heuristic: Find all blocks of text that have at least 2 lines and contain " - " or " @ " or typical odds
-            # Actually, standardizing on valid odds buttons is best.
-            
-            # locate all odds buttons
-            buttons = page.locator("div[role='button']").all() # broad
-            print(f"Found {len(buttons)} total clickable divs/buttons.")
-            
-            # filtering for odds-like text
-            odds_buttons = []
-            for btn in buttons:
-                txt = btn.inner_text().strip()
-                if txt.startswith('-') or txt.startswith('+') or txt == "even":
-                    # Check length to avoid long text
-                    if len(txt) < 6:
-                        odds_buttons.append(btn)
-            
-            print(f"Found {len(odds_buttons)} potential odds buttons.")
-            
-            # If we found odds buttons, group them by their parent container
-            # This helps identify "Games"
-            parent_map = {}
-            for btn in odds_buttons:
-                parent = btn.locator("xpath=..").locator("xpath=..").locator("xpath=..") # Go up 3 levels
-                # This is a guess on depth.
-                # Adjust depth based on visual inspection if needed.
-                # For now, let's just grab the text of the *entire* page content to a file 
-                # effectively doing a "Dump" so the user can verify if data is there.
-                pass
-
-            # Backup: Just dump specific text content of likely game elements
-            # Look for team names in our known list?
-            # "Celtics", "Lakers", etc.
-            
-            # Get all text from the page
-            all_text = page.inner_text("body")
-            
-            # Save raw text for analysis
-            with open(f"{output_dir}/caesars_nba_manual_dump.txt", "w", encoding="utf-8") as f:
-                f.write(all_text)
-            print(f"Saved full page text dump to {output_dir}/caesars_nba_manual_dump.txt")
-            
-            # Attempt to parse the text dump for games (Basic regex/splitting)
-            # This is a fallback if DOM traversal is too complex without inspection
-            # ...
+            # Do the whole button-filter + ancestor-grouping walk in one
+            # page.evaluate: one driver round-trip instead of an inner_text()
+            # call per button plus three xpath hops per odds button, and the
+            # DOM traversal runs at native browser speed.
+            games_data = page.evaluate("""() => {
+                const isOdds = (t) => /^[-+]\\d{2,4}$/.test(t) || t.toLowerCase() === 'even';
+                const btns = [...document.querySelectorAll("div[role='button']")]
+                    .filter(b => { const t = b.innerText.trim(); return t.length < 6 && isOdds(t); });
+                const groups = new Map();
+                for (const b of btns) {
+                    // Prefer a recognizable event container; fall back to 3 levels up
+                    const p = b.closest("[data-testid*='event'], [class*='EventCard'], [class*='game']")
+                        || b.parentElement?.parentElement?.parentElement;
+                    if (!p) continue;
+                    if (!groups.has(p)) groups.set(p, { text: p.innerText, odds: [] });
+                    groups.get(p).odds.push(b.innerText.trim());
+                }
+                return [...groups.values()];
+            }""")
+            print(f"Grouped odds buttons into {len(games_data)} candidate games.")
+
+            if games_data:
+                with open(f"{output_dir}/caesars_nba_games.json", "w", encoding="utf-8") as f:
+                    json.dump(games_data, f, indent=2)
+                print(f"Saved grouped game candidates to {output_dir}/caesars_nba_games.json")
+
+            # Backup: full-page text dump for offline analysis. inner_text
+            # on body walks the whole rendered tree and ships multi-MB of
+            # text over IPC, so it only runs when explicitly requested.
+            if os.environ.get("CAESARS_DEBUG"):
+                all_text = page.inner_text("body")
+                with open(f"{output_dir}/caesars_nba_manual_dump.txt", "w", encoding="utf-8") as f:
+                    f.write(all_text)
+                print(f"Saved full page text dump to {output_dir}/caesars_nba_manual_dump.txt")
 
         except Exception as e:
             print(f"Error extracting: {e}")
@@ -132,4 +217,7 @@ def fetch_caesars_nba():
         context.close()
 
 if __name__ == "__main__":
-    fetch_caesars_nba()
+    # Direct API first; the manual browser flow remains the fallback for when
+    # the endpoint changes or starts demanding browser-established cookies.
+    if not fetch_caesars_nba_api():
+        fetch_caesars_nba()
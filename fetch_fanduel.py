@@ -5,6 +5,40 @@ import csv
 from datetime import datetime
 from playwright.sync_api import sync_playwright
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+from utils.response_cache import ResponseCache
+
+# The master payload runs to megabytes; orjson decodes it several times
+# faster than stdlib json. Both accept raw bytes.
+_json_loads = orjson.loads if HAVE_ORJSON else json.loads
+
+# Only the JSON payload matters here; xhr/fetch never match these globs so
+# the master-payload listener still fires. Glob routes are evaluated in the
+# driver, so non-matching requests skip the Python callback entirely.
+_BLOCKED_HOST_GLOB = "**{googletagmanager,google-analytics,doubleclick,segment.io,optimizely,newrelic}**"
+_BLOCKED_ASSET_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf,mp4,css}*"
+
+def _launch_browser(p, **launch_kwargs):
+    """
+    Connects to a long-lived browser server when PLAYWRIGHT_WS_ENDPOINT is
+    set (start one with `playwright launch-server --browser chromium`), so
+    scheduled runs skip the ~2s Chromium startup; otherwise launches fresh.
+    Closing the returned browser only disconnects when connected.
+    """
+    ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+    if ws_endpoint:
+        return p.chromium.connect(ws_endpoint)
+    return p.chromium.launch(**launch_kwargs)
+
+# The three league navigations share one context, so bundles fetched for the
+# first league serve the next two straight from memory.
+_RESPONSE_CACHE = ResponseCache()
+
 def parse_fanduel_data(data, league_name):
     """
     Parses the 'attachments' extracted from the FanDuel JSON.
@@ -18,6 +52,11 @@ def parse_fanduel_data(data, league_name):
     
     print(f"[{league_name}] Parsing {len(markets)} markets, {len(events)} events...")
 
+    # Loop-invariant: every row in this batch shares one timestamp, and the
+    # URL sport segment only depends on the league
+    fetch_time = datetime.now().isoformat()
+    sport_url = league_name.lower()
+
     for market_id, market in markets.items():
         # Filter for Moneyline
         market_name = market.get("marketName")
@@ -39,13 +78,10 @@ def parse_fanduel_data(data, league_name):
         is_live = market.get("inplay", False)
         
         # Format Date (ensure ISO if possible, but FD usually gives ISO)
-        
-        fetch_time = datetime.now().isoformat()
-        
+
         # Construct URL
         # FanDuel URL format: https://sportsbook.fanduel.com/navigation/{sport}?tab=upcoming&eventId={eventId}
         # Sport name needs to be lowercase for URL
-        sport_url = league_name.lower()
         event_url = f"https://sportsbook.fanduel.com/navigation/{sport_url}?tab=upcoming&eventId={event_id}"
 
         row = {
@@ -93,7 +129,8 @@ def scrape_fanduel():
     all_rows = []
     
     with sync_playwright() as p:
-        browser = p.chromium.launch(
+        browser = _launch_browser(
+            p,
             headless=False,
             channel="chrome", # Use system Chrome for trust
             args=["--disable-blink-features=AutomationControlled"]
@@ -105,8 +142,14 @@ def scrape_fanduel():
         
         # Anti-detection
         context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+        # Later registrations are consulted first: tracker/asset aborts win,
+        # and only script URLs fall through to the Python cache handler.
+        context.route("**/*.js*", _RESPONSE_CACHE.handle)
+        context.route(_BLOCKED_ASSET_GLOB, lambda route: route.abort())
+        context.route(_BLOCKED_HOST_GLOB, lambda route: route.abort())
+
         page = context.new_page()
+        page.on("response", _RESPONSE_CACHE.store)
 
         leagues = {
             "NBA": "https://sportsbook.fanduel.com/navigation/nba",
@@ -114,60 +157,47 @@ def scrape_fanduel():
             "NHL": "https://sportsbook.fanduel.com/navigation/nhl"
         }
         
+        def is_master_payload(response):
+            # Heuristic: a JSON body carrying 'attachments.markets' is the
+            # master odds payload; getMarketPrices deltas are skipped.
+            # Cheap header checks run first so the body download + JSON parse
+            # only happens for plausibly large candidates.
+            try:
+                if "json" not in response.headers.get("content-type", ""):
+                    return False
+                if "getMarketPrices" in response.url:
+                    return False
+                content_length = response.headers.get("content-length")
+                if content_length is not None and int(content_length) < 10000:
+                    return False  # Master payload is hundreds of KB
+                data = _json_loads(response.body())
+                return "attachments" in data and "markets" in data["attachments"]
+            except Exception:
+                return False
+
         for league, url in leagues.items():
             print(f"Fetching {league} from {url}...")
-            
-            # Container for the extracted payload
-            target_payload = None
-            
-            def handle_response(response):
-                nonlocal target_payload
-                try:
-                    if target_payload: return # Already found
-                    
-                    if "json" in response.headers.get("content-type", ""):
-                        # Check URL keywords
-                        if "getMarketPrices" in response.url: return # Skip minor updates
-                        
-                        try:
-                            data = response.json()
-                            # Heuristic: must have 'attachments' and 'markets'
-                            if "attachments" in data and "markets" in data["attachments"]:
-                                print(f"[{league}] Found Master Payload: {response.url}")
-                                target_payload = data
-                        except:
-                            pass
-                except:
-                    pass
-
-            # Attach listener
-            page.on("response", handle_response)
-            
+
             try:
-                page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                
-                # Scroll to encourage loading
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                
-                # Wait for payload capture
-                start_time = time.time()
-                while not target_payload and time.time() - start_time < 20:
-                    page.wait_for_timeout(500)
-                    
-                if target_payload:
-                    league_rows = parse_fanduel_data(target_payload, league)
-                    all_rows.extend(league_rows)
-                    print(f"[{league}] Extracted {len(league_rows)} odds.")
-                else:
-                     print(f"[{league}] FAILED to capture master payload.")
-                     
+                # expect_response returns the instant the payload arrives
+                # instead of polling every 500ms for up to 20s.
+                with page.expect_response(is_master_payload, timeout=20000) as resp_info:
+                    page.goto(url, timeout=60000, wait_until="domcontentloaded")
+
+                    # Scroll to encourage loading
+                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+                target_payload = _json_loads(resp_info.value.body())
+                print(f"[{league}] Found Master Payload: {resp_info.value.url}")
+
+                league_rows = parse_fanduel_data(target_payload, league)
+                all_rows.extend(league_rows)
+                print(f"[{league}] Extracted {len(league_rows)} odds.")
+
                 page.wait_for_timeout(2000) # Polite gap
-                
+
             except Exception as e:
-                print(f"[{league}] Error: {e}")
-            
-            # Remove listener for next iteration
-            page.remove_listener("response", handle_response)
+                print(f"[{league}] FAILED to capture master payload: {e}")
 
         browser.close()
         
@@ -176,9 +206,11 @@ def scrape_fanduel():
         csv_path = "fanduel_data/fd_moneyline_odds.csv"
         keys = ["Sport", "Game_Date", "Event", "BetType", "HomeTeam", "HomeOdds", "AwayTeam", "AwayOdds", "Is_Live", "Fetched_At", "Url"]
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(all_rows)
+            # csv.writer on pre-ordered tuples: one dispatch per row instead
+            # of a dict lookup per field per row
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows(tuple(r[k] for k in keys) for r in all_rows)
         print(f"\nSUCCESS: Saved {len(all_rows)} rows to {csv_path}")
     else:
         print("\nFAILURE: No data extracted.")
@@ -1,122 +1,173 @@
+import asyncio
 import csv
 import os
-import time
+import re
 from datetime import datetime
-from pm_universe.kalshi import KalshiClient
+
+import httpx
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+from pm_universe.kalshi import KALSHI_BASE_URL
 from utils.odds_conversion import prob_to_moneyline
 
 OUTPUT_DIR = "kalshi_data"
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "kalshi_odds.csv")
 
+# One anchored capture replaces the replace()+split()+"Winner" checks and
+# lets the market loop run without a per-row try/except.
+_TITLE_RE = re.compile(r"^(.+?) at (.+?) Winner\?$")
+
+class _SharedAsyncLimiter:
+    """
+    Async counterpart of pm_universe's RateLimiter: both series coroutines
+    share the same API quota, so a single limiter schedules every request.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0):
+        self._interval = 1.0 / requests_per_second
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+async def _fetch_series_markets(client, limiter, series):
+    """Paginates one series' markets; pages overlap with the other series."""
+    print(f"Fetching {series}...")
+    markets = []
+    cursor = None
+    while True:
+        await limiter.wait()
+        params = {"series_ticker": series, "limit": 100}
+        if cursor:
+            params["cursor"] = cursor
+
+        resp = await client.get("/markets", params=params)
+        resp.raise_for_status()
+        # orjson is noticeably faster than stdlib on the 100-market pages
+        data = orjson.loads(resp.content) if HAVE_ORJSON else resp.json()
+
+        markets.extend(data.get("markets", []))
+        cursor = data.get("cursor")
+
+        if not cursor:
+            break
+
+    print(f"  Found {len(markets)} markets for {series}")
+    return markets
+
+async def _fetch_all_series(series_list):
+    limiter = _SharedAsyncLimiter(requests_per_second=2.0)
+    async with httpx.AsyncClient(
+        base_url=KALSHI_BASE_URL,
+        timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0),
+    ) as client:
+        results = await asyncio.gather(
+            *(_fetch_series_markets(client, limiter, series) for series in series_list),
+            return_exceptions=True,
+        )
+    return dict(zip(series_list, results))
+
 def fetch_kalshi_odds():
     print("Fetching Kalshi sports markets (Direct Series Fetch)...")
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
+
     fetch_time = datetime.now().isoformat()
     events_map = {} # event_ticker -> { Info }
 
-    with KalshiClient() as client:
-        # Fetch NBA and NFL Game Markets
-        series_to_fetch = ["KXNBAGAME", "KXNFLGAME"]
-        
-        for series in series_to_fetch:
-            print(f"Fetching {series}...")
-            try:
-                # We use the internal http client to query specific series directly
-                # to ensure we get the game markets we identified in debugging.
-                # Pagination might be needed if there are many games.
-                markets = []
-                cursor = None
-                while True:
-                    client.rate_limiter.wait()
-                    params = {"series_ticker": series, "limit": 100}
-                    if cursor:
-                        params["cursor"] = cursor
-                        
-                    resp = client.client.get("/markets", params=params)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    
-                    batch = data.get("markets", [])
-                    markets.extend(batch)
-                    cursor = data.get("cursor")
-                    
-                    if not cursor:
-                        break
-                        
-                print(f"  Found {len(markets)} markets for {series}")
-                
-                for m in markets:
-                    # We expect markets like "Memphis at Golden State Winner?"
-                    title = m.get("title", "")
-                    yes_sub_title = m.get("yes_sub_title", "")
-                    event_ticker = m.get("event_ticker")
-                    
-                    if not event_ticker or " at " not in title or "Winner" not in title:
-                        continue
-                        
-                    # Parse Matchup
-                    # Title: "TeamA at TeamB Winner?"
-                    try:
-                        clean_title = title.replace(" Winner?", "").strip()
-                        parts = clean_title.split(" at ")
-                        if len(parts) != 2:
-                            continue
-                            
-                        away_team = parts[0].strip()
-                        home_team = parts[1].strip()
-                        
-                        # Initialize event entry
-                        if event_ticker not in events_map:
-                            # Date
-                            game_date = m.get("open_time", m.get("commence_time", ""))
-                            if not game_date: game_date = m.get("expiration_time", "")
-
-                            events_map[event_ticker] = {
-                                "Sport": "NBA" if "NBA" in series else "NFL",
-                                "Game_Date": game_date,
-                                "Event": f"{away_team} vs {home_team}", # Standardize as Away vs Home
-                                "BetType": "Moneyline",
-                                "HomeTeam": home_team,
-                                "AwayTeam": away_team,
-                                "HomeOdds": None,
-                                "AwayOdds": None,
-                                "Is_Live": False, # Kalshi markets are usually pre-match futures style
-                                "Fetched_At": fetch_time,
-                                "Url": f"https://kalshi.com/markets/{event_ticker}" if event_ticker else ""
-                            }
-                        
-                        entry = events_map[event_ticker]
-                        
-                        # Get Price (Yes Ask = Cost to buy Yes)
-                        # Price is in cents.
-                        yes_ask = m.get("yes_ask")
-                        if yes_ask is None: continue
-                        
-                        prob = float(yes_ask) / 100.0
-                        if prob <= 0 or prob >= 1:
-                            moneyline = None
-                        else:
-                            moneyline = prob_to_moneyline(prob)
-                            
-                        # Assign to Home or Away
-                        # yes_sub_title should match one of the teams
-                        if yes_sub_title == home_team:
-                            entry["HomeOdds"] = moneyline
-                        elif yes_sub_title == away_team:
-                            entry["AwayOdds"] = moneyline
-                            
-                    except Exception as e:
-                        print(f"Error parsing market {m.get('ticker')}: {e}")
-                        continue
-
-            except Exception as e:
-                print(f"Error fetching {series}: {e}")
+    # Fetch NBA and NFL Game Markets concurrently; the shared limiter keeps
+    # the combined request rate identical to the old sequential loop, but the
+    # network round-trips of the two series overlap.
+    series_to_fetch = ["KXNBAGAME", "KXNFLGAME"]
+    markets_by_series = asyncio.run(_fetch_all_series(series_to_fetch))
+
+    for series in series_to_fetch:
+        markets = markets_by_series[series]
+        if isinstance(markets, BaseException):
+            print(f"Error fetching {series}: {markets}")
+            continue
+
+        for m in markets:
+            # We expect markets like "Memphis at Golden State Winner?"
+            title = m.get("title", "")
+            yes_sub_title = m.get("yes_sub_title", "")
+            event_ticker = m.get("event_ticker")
+
+            if not event_ticker:
+                continue
+
+            # Parse Matchup
+            # Title: "TeamA at TeamB Winner?"
+            title_match = _TITLE_RE.match(title)
+            if not title_match:
+                continue
+
+            away_team = title_match.group(1).strip()
+            home_team = title_match.group(2).strip()
+
+            # Get Price (Yes Ask = Cost to buy Yes)
+            # Price is in cents.
+            yes_ask = m.get("yes_ask")
+            if yes_ask is None:
+                continue
+
+            # Initialize event entry
+            if event_ticker not in events_map:
+                # Date
+                game_date = m.get("open_time", m.get("commence_time", ""))
+                if not game_date: game_date = m.get("expiration_time", "")
+
+                events_map[event_ticker] = {
+                    "Sport": "NBA" if "NBA" in series else "NFL",
+                    "Game_Date": game_date,
+                    "Event": f"{away_team} vs {home_team}", # Standardize as Away vs Home
+                    "BetType": "Moneyline",
+                    "HomeTeam": home_team,
+                    "AwayTeam": away_team,
+                    "HomeOdds": None,
+                    "AwayOdds": None,
+                    "Is_Live": False, # Kalshi markets are usually pre-match futures style
+                    "Fetched_At": fetch_time,
+                    "Url": f"https://kalshi.com/markets/{event_ticker}",
+                    # Built once per event: maps the sub_title straight to the
+                    # column to fill, and casefolding absorbs the whitespace/
+                    # case drift between titles and sub_titles. Stripped
+                    # before the rows are written out.
+                    "_lookup": {
+                        home_team.casefold(): "HomeOdds",
+                        away_team.casefold(): "AwayOdds",
+                    },
+                }
+
+            entry = events_map[event_ticker]
+
+            prob = float(yes_ask) / 100.0
+            if prob <= 0 or prob >= 1:
+                moneyline = None
+            else:
+                moneyline = prob_to_moneyline(prob)
+
+            # Assign to Home or Away
+            # yes_sub_title should match one of the teams
+            field = entry["_lookup"].get(yes_sub_title.strip().casefold())
+            if field:
+                entry[field] = moneyline
 
     # Convert map to list
     rows = []
     for evt in events_map.values():
         if evt["HomeOdds"] is not None and evt["AwayOdds"] is not None:
+            evt.pop("_lookup", None)
             rows.append(evt)
 
     if rows:
@@ -124,11 +175,13 @@ def fetch_kalshi_odds():
         # Add BetType field constant (legacy compatibility)
         for r in rows:
             r["BetType"] = r.get("BetType", "Moneyline")
-            
+
         with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(rows)
+            # csv.writer on pre-ordered tuples: one dispatch per row instead
+            # of a dict lookup per field per row
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows(tuple(r[k] for k in keys) for r in rows)
         print(f"Saved {len(rows)} Kalshi games to {OUTPUT_FILE}")
         return True
     else:
@@ -1,7 +1,28 @@
 import re
+from functools import lru_cache
+
+try:
+    # C-implemented multi-pattern matcher; falls back to a linear substring
+    # scan over the mapping keys when unavailable
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
 
 STOP_WORDS = {"THE"}
 
+# Compiled once: skips the re-cache lookup on every substitution
+_DIGITS_RE = re.compile(r'\d+')
+
+_REPLACEMENTS = {
+    "SAINT": "ST",
+    "ST": "ST",
+    "SAINTS": "STS",
+    "MT.": "MT",
+    "MOUNT": "MT",
+    "MT": "MT",
+}
+
 def _canonicalize_freeform_name(name: str) -> str:
     """
     Applies generic cleanup so aliases like 'St. Louis' and 'Saint Louis'
@@ -10,32 +31,387 @@ def _canonicalize_freeform_name(name: str) -> str:
     if not isinstance(name, str):
         return ""
 
-    cleaned = name.upper()
-    cleaned = cleaned.replace("&", " AND ")
-    cleaned = re.sub(r'[^A-Z0-9 ]', ' ', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-
-    replacements = {
-        "SAINT": "ST",
-        "ST": "ST",
-        "SAINTS": "STS",
-        "MT.": "MT",
-        "MOUNT": "MT",
-        "MT": "MT",
-    }
-
+    # One fused pass: any non-alphanumeric run ends the current token, and
+    # stop-word filtering plus alias replacement happen as tokens are
+    # emitted — no intermediate cleaned string or separate split loop.
     tokens = []
-    for token in cleaned.split():
-        if token in STOP_WORDS:
-            continue
-        token = replacements.get(token, token)
-        tokens.append(token)
+    buf = []
+    for ch in name.upper().replace("&", " AND "):
+        if 'A' <= ch <= 'Z' or '0' <= ch <= '9':
+            buf.append(ch)
+        elif buf:
+            token = ''.join(buf)
+            buf.clear()
+            if token not in STOP_WORDS:
+                tokens.append(_REPLACEMENTS.get(token, token))
+    if buf:
+        token = ''.join(buf)
+        if token not in STOP_WORDS:
+            tokens.append(_REPLACEMENTS.get(token, token))
 
     return " ".join(tokens)
 
-def normalize_team(name):
+# Split per league so ambiguous city names ("NEW YORK", "LOS ANGELES",
+# "TAMPA BAY") resolve against the right sport when the caller knows it;
+# built once at import.
+_NBA_MAPPINGS = {
+    # City Mappings
+    "ATLANTA": "ATL",
+    "BOSTON": "BOS",
+    "BROOKLYN": "BKN",
+    "CHARLOTTE": "CHA",
+    "CHICAGO": "CHI",
+    "CLEVELAND": "CLE",
+    "DALLAS": "DAL",
+    "DENVER": "DEN",
+    "DETROIT": "DET",
+    "GOLDEN STATE": "GSW",
+    "HOUSTON": "HOU",
+    "INDIANA": "IND",
+    "LA CLIPPERS": "LAC",
+    "LA LAKERS": "LAL",
+    "LOS ANGELES": "LAL", # Context dependent usually, but if just city...
+    "LOS ANGELES C": "LAC",
+    "LOS ANGELES L": "LAL",
+    "MEMPHIS": "MEM",
+    "MIAMI": "MIA",
+    "MILWAUKEE": "MIL",
+    "MINNESOTA": "MIN",
+    "NEW ORLEANS": "NOP",
+    "NEW YORK": "NYK",
+    "OKLAHOMA CITY": "OKC",
+    "ORLANDO": "ORL",
+    "PHILADELPHIA": "PHI",
+    "PHOENIX": "PHX",
+    "PORTLAND": "POR",
+    "SACRAMENTO": "SAC",
+    "SAN ANTONIO": "SAS",
+    "TORONTO": "TOR",
+    "UTAH": "UTA",
+    "WASHINGTON": "WAS",
+
+    # Nicknames / Short
+    "THUNDER": "OKC",
+    "NUGGETS": "DEN",
+    "WARRIORS": "GSW",
+    "LAKERS": "LAL",
+    "CLIPPERS": "LAC",
+    "CELTICS": "BOS",
+    "KNICKS": "NYK",
+    "NETS": "BKN",
+    "RAPTORS": "TOR",
+    "76ERS": "PHI",
+    "PHI ERS": "PHI",
+    "SIXERS": "PHI",
+    "HEAT": "MIA",
+    "MAGIC": "ORL",
+    "HAWKS": "ATL",
+    "HORNETS": "CHA",
+    "WIZARDS": "WAS",
+    "CAVALIERS": "CLE",
+    "CAVS": "CLE",
+    "PISTONS": "DET",
+    "PACERS": "IND",
+    "BULLS": "CHI",
+    "BUCKS": "MIL",
+    "TIMBERWOLVES": "MIN",
+    "WOLVES": "MIN",
+    "JAZZ": "UTA",
+    "TRAIL BLAZERS": "POR",
+    "BLAZERS": "POR",
+    "KINGS": "SAC",
+    "SUNS": "PHX",
+    "MAVERICKS": "DAL",
+    "MAVS": "DAL",
+    "ROCKETS": "HOU",
+    "GRIZZLIES": "MEM",
+    "PELICANS": "NOP",
+    "PELS": "NOP",
+    "SPURS": "SAS",
+
+    # Full Names
+    "OKLAHOMA CITY THUNDER": "OKC",
+    "OKC THUNDER": "OKC",
+    "DENVER NUGGETS": "DEN",
+    "GOLDEN STATE WARRIORS": "GSW",
+    "LOS ANGELES LAKERS": "LAL",
+    "L.A. LAKERS": "LAL",
+    "LOS ANGELES CLIPPERS": "LAC",
+    "L.A. CLIPPERS": "LAC",
+    "BOSTON CELTICS": "BOS",
+    "NEW YORK KNICKS": "NYK",
+    "NY KNICKS": "NYK",
+    "BROOKLYN NETS": "BKN",
+    "TORONTO RAPTORS": "TOR",
+    "PHILADELPHIA 76ERS": "PHI",
+    "MIAMI HEAT": "MIA",
+    "ORLANDO MAGIC": "ORL",
+    "ATLANTA HAWKS": "ATL",
+    "CHARLOTTE HORNETS": "CHA",
+    "WASHINGTON WIZARDS": "WAS",
+    "CLEVELAND CAVALIERS": "CLE",
+    "DETROIT PISTONS": "DET",
+    "INDIANA PACERS": "IND",
+    "CHICAGO BULLS": "CHI",
+    "MILWAUKEE BUCKS": "MIL",
+    "MINNESOTA TIMBERWOLVES": "MIN",
+    "UTAH JAZZ": "UTA",
+    "PORTLAND TRAIL BLAZERS": "POR",
+    "SACRAMENTO KINGS": "SAC",
+    "PHOENIX SUNS": "PHX",
+    "DALLAS MAVERICKS": "DAL",
+    "HOUSTON ROCKETS": "HOU",
+    "MEMPHIS GRIZZLIES": "MEM",
+    "NEW ORLEANS PELICANS": "NOP",
+    "SAN ANTONIO SPURS": "SAS",
+}
+
+_NHL_MAPPINGS = {
+    "ANAHEIM DUCKS": "ANA",
+    "ANAHEIM": "ANA",
+    "ARIZONA COYOTES": "ARI", # Relocated to Utah but keep for history
+    "BOSTON BRUINS": "BOS",
+    "BUFFALO SABRES": "BUF",
+    "BUFFALO": "BUF",
+    "CALGARY FLAMES": "CGY",
+    "CALGARY": "CGY",
+    "CAROLINA HURRICANES": "CAR",
+    "CAROLINA": "CAR",
+    "CHICAGO BLACKHAWKS": "CHI",
+    "COLORADO AVALANCHE": "COL",
+    "COLORADO": "COL",
+    "COLUMBUS BLUE JACKETS": "CBJ",
+    "COLUMBUS": "CBJ",
+    "DALLAS STARS": "DAL",
+    "DETROIT RED WINGS": "DET",
+    "EDMONTON OILERS": "EDM",
+    "EDMONTON": "EDM",
+    "FLORIDA PANTHERS": "FLA",
+    "FLORIDA": "FLA",
+    "LOS ANGELES KINGS": "LAK",
+    "LOS ANGELES": "LAK",
+    "MINNESOTA WILD": "MIN",
+    "MONTREAL CANADIENS": "MTL",
+    "MONTREAL": "MTL",
+    "NASHVILLE PREDATORS": "NSH",
+    "NASHVILLE": "NSH",
+    "NEW JERSEY DEVILS": "NJ",
+    "NEW JERSEY": "NJ",
+    "NEW YORK ISLANDERS": "NYI",
+    "NEW YORK RANGERS": "NYR",
+    "OTTAWA SENATORS": "OTT",
+    "OTTAWA": "OTT",
+    "PHILADELPHIA FLYERS": "PHI",
+    "PITTSBURGH PENGUINS": "PIT",
+    "PITTSBURGH": "PIT",
+    "SAN JOSE SHARKS": "SJS",
+    "SAN JOSE": "SJS",
+    "SEATTLE KRAKEN": "SEA",
+    "SEATTLE": "SEA",
+    "ST. LOUIS BLUES": "STL",
+    "ST. LOUIS": "STL",
+    "TAMPA BAY LIGHTNING": "TBL",
+    "TAMPA BAY": "TBL",
+    "TORONTO MAPLE LEAFS": "TOR",
+    "UTAH HOCKEY CLUB": "UTA",
+    "UTAH": "UTA",
+    "VANCOUVER CANUCKS": "VAN",
+    "VANCOUVER": "VAN",
+    "VEGAS GOLDEN KNIGHTS": "VGK",
+    "VEGAS": "VGK",
+    "WASHINGTON CAPITALS": "WAS",
+    "WINNIPEG JETS": "WPG",
+    "WINNIPEG": "WPG",
+
+    # Shorts
+    "BRUINS": "BOS",
+    "SABRES": "BUF",
+    "RED WINGS": "DET",
+    "FLAMES": "CGY",
+    "HURRICANES": "CAR",
+    "BLACKHAWKS": "CHI",
+    "AVALANCHE": "COL",
+    "BLUE JACKETS": "CBJ",
+    "STARS": "DAL",
+    "OILERS": "EDM",
+    "PANTHERS": "FLA",
+    "KINGS": "LAK",
+    "WILD": "MIN",
+    "CANADIENS": "MTL",
+    "PREDATORS": "NSH",
+    "DEVILS": "NJ",
+    "ISLANDERS": "NYI",
+    "RANGERS": "NYR",
+    "SENATORS": "OTT",
+    "FLYERS": "PHI",
+    "PENGUINS": "PIT",
+    "SHARKS": "SJS",
+    "KRAKEN": "SEA",
+    "BLUES": "STL",
+    "LIGHTNING": "TBL",
+    "MAPLE LEAFS": "TOR",
+    "CANUCKS": "VAN",
+    "GOLDEN KNIGHTS": "VGK",
+    "OCAPITALS": "WAS",
+    "CAPITALS": "WAS",
+    "JETS": "WPG",
+}
+
+_NFL_MAPPINGS = {
+    "ARIZONA CARDINALS": "ARI",
+    "ATLANTA FALCONS": "ATL",
+    "BALTIMORE RAVENS": "BAL",
+    "BALTIMORE": "BAL",
+    "BUFFALO BILLS": "BUF",
+    "CAROLINA PANTHERS": "CAR",
+    "CINCINNATI BENGALS": "CIN",
+    "CINCINNATI": "CIN",
+    "CLEVELAND BROWNS": "CLE",
+    "DALLAS COWBOYS": "DAL",
+    "DENVER BRONCOS": "DEN",
+    "DETROIT LIONS": "DET",
+    "GREEN BAY PACKERS": "GB",
+    "GREEN BAY": "GB",
+    "HOUSTON TEXANS": "HOU",
+    "INDIANAPOLIS COLTS": "IND",
+    "INDIANAPOLIS": "IND",
+    "JACKSONVILLE JAGUARS": "JAX",
+    "JACKSONVILLE": "JAX",
+    "KANSAS CITY CHIEFS": "KC",
+    "KANSAS CITY": "KC",
+    "LAS VEGAS RAIDERS": "LV",
+    "LAS VEGAS": "LV",
+    "LOS ANGELES CHARGERS": "LAC",
+    "LOS ANGELES RAMS": "LAR",
+    "MIAMI DOLPHINS": "MIA",
+    "MINNESOTA VIKINGS": "MIN",
+    "NEW ENGLAND PATRIOTS": "NE",
+    "NEW ENGLAND": "NE",
+    "NEW ORLEANS SAINTS": "NO",
+    "NEW YORK GIANTS": "NYG",
+    "NEW YORK JETS": "NYJ",
+    "PHILADELPHIA EAGLES": "PHI",
+    "PITTSBURGH STEELERS": "PIT",
+    "SAN FRANCISCO 49ERS": "SF",
+    "SAN FRANCISCO": "SF",
+    "SEATTLE SEAHAWKS": "SEA",
+    "TAMPA BAY BUCCANEERS": "TB",
+    "TENNESSEE TITANS": "TEN",
+    "TENNESSEE": "TEN",
+    "WASHINGTON COMMANDERS": "WAS",
+
+    # Shorts
+    "CARDINALS": "ARI",
+    "FALCONS": "ATL",
+    "RAVENS": "BAL",
+    "BILLS": "BUF",
+    "PANTHERS": "CAR",
+    "BENGALS": "CIN",
+    "BROWNS": "CLE",
+    "COWBOYS": "DAL",
+    "BRONCOS": "DEN",
+    "LIONS": "DET",
+    "PACKERS": "GB",
+    "TEXANS": "HOU",
+    "COLTS": "IND",
+    "JAGUARS": "JAX",
+    "CHIEFS": "KC",
+    "RAIDERS": "LV",
+    "CHARGERS": "LAC",
+    "RAMS": "LAR",
+    "DOLPHINS": "MIA",
+    "VIKINGS": "MIN",
+    "PATRIOTS": "NE",
+    "SAINTS": "NO",
+    "GIANTS": "NYG",
+    "JETS": "NYJ",
+    "EAGLES": "PHI",
+    "STEELERS": "PIT",
+    "49ERS": "SF",
+    "SEAHAWKS": "SEA",
+    "BUCCANEERS": "TB",
+    "TITANS": "TEN",
+    "COMMANDERS": "WAS",
+}
+
+_MAPPINGS_BY_LEAGUE = {
+    "NBA": _NBA_MAPPINGS,
+    "NHL": _NHL_MAPPINGS,
+    "NFL": _NFL_MAPPINGS,
+}
+
+# Union table for callers without league context. Built first-wins so the
+# colliding nicknames keep the values the old single table had
+# ("KINGS" -> SAC, "PANTHERS" -> FLA, "JETS" -> WPG, "LOS ANGELES" -> LAL).
+_MAPPINGS = {}
+for _league_table in _MAPPINGS_BY_LEAGUE.values():
+    for _key, _code in _league_table.items():
+        _MAPPINGS.setdefault(_key, _code)
+
+def _build_automaton(mappings):
+    ac = ahocorasick.Automaton()
+    for key, code in mappings.items():
+        ac.add_word(key, (len(key), code))
+    ac.make_automaton()
+    return ac
+
+if HAVE_AHOCORASICK:
+    # Finds every mapping key embedded in a name in one linear pass; one
+    # automaton per league plus the union, all built once at import.
+    _AC = _build_automaton(_MAPPINGS)
+    _AC_BY_LEAGUE = {lg: _build_automaton(m) for lg, m in _MAPPINGS_BY_LEAGUE.items()}
+else:
+    _AC = None
+    _AC_BY_LEAGUE = {}
+
+def _lookup_code(mappings, automaton, name, canonical_name):
+    """Resolves a cleaned name against one mapping table, or returns None."""
+    # Check exact match
+    if name in mappings:
+        return mappings[name]
+    if canonical_name in mappings:
+        return mappings[canonical_name]
+
+    # Check token n-grams, longest first: a few hash lookups instead of a
+    # substring scan over every mapping key
+    tokens = canonical_name.split()
+    for size in (3, 2, 1):
+        for i in range(len(tokens) - size + 1):
+            gram = " ".join(tokens[i:i + size])
+            if gram in mappings:
+                return mappings[gram]
+
+    # Last resort: find mapping keys embedded anywhere in the raw or
+    # canonical name (catches punctuated keys like "ST. LOUIS"). With the
+    # automaton this is one pass keeping the longest hit; otherwise the
+    # old linear scan over every key.
+    if automaton is not None:
+        best = None
+        for haystack in (name, canonical_name):
+            if not haystack:
+                continue
+            for _, (length, code) in automaton.iter(haystack):
+                if best is None or length > best[0]:
+                    best = (length, code)
+        if best is not None:
+            return best[1]
+    else:
+        for rich_name, code in mappings.items():
+            if rich_name in name:
+                return code
+            if canonical_name and rich_name in canonical_name:
+                return code
+
+    return None
+
+@lru_cache(maxsize=4096)
+def normalize_team(name, league=None):
     """
     Normalizes a team name to a canonical version.
+    Pure and called with a small set of distinct strings, so the result is
+    memoized; repeated rows hit the cache instead of rebuilding the mapping.
+    When the caller knows the league, that table is consulted first so
+    city-only names like "New York" resolve to the right sport's code.
     Example: "Oklahoma City Thunder" -> "OKC"
              "OKC Thunder" -> "OKC"
              "New York Knicks" -> "NYK"
@@ -46,302 +422,34 @@ def normalize_team(name):
     name = name.strip().upper()
     # Remove scores (digits)
     # Example: "ATL HAWKS 102" -> "ATL HAWKS " -> "ATL HAWKS"
-    name = re.sub(r'\d+', '', name).strip()
+    name = _DIGITS_RE.sub('', name).strip()
     canonical_name = _canonicalize_freeform_name(name)
-    
-    # NBA
-    mappings = {
-        # Custom / City Mappings
-        "ATLANTA": "ATL",
-        "BOSTON": "BOS",
-        "BROOKLYN": "BKN",
-        "CHARLOTTE": "CHA",
-        "CHICAGO": "CHI",
-        "CLEVELAND": "CLE",
-        "DALLAS": "DAL",
-        "DENVER": "DEN",
-        "DETROIT": "DET",
-        "GOLDEN STATE": "GSW",
-        "HOUSTON": "HOU",
-        "INDIANA": "IND",
-        "LA CLIPPERS": "LAC",
-        "LA LAKERS": "LAL",
-        "LOS ANGELES": "LAL", # Context dependent usually, but if just city...
-        "LOS ANGELES C": "LAC",
-        "LOS ANGELES L": "LAL",
-        "MEMPHIS": "MEM",
-        "MIAMI": "MIA",
-        "MILWAUKEE": "MIL",
-        "MINNESOTA": "MIN",
-        "NEW ORLEANS": "NOP",
-        "NEW YORK": "NYK",
-        "OKLAHOMA CITY": "OKC",
-        "ORLANDO": "ORL",
-        "PHILADELPHIA": "PHI",
-        "PHOENIX": "PHX",
-        "PORTLAND": "POR",
-        "SACRAMENTO": "SAC",
-        "SAN ANTONIO": "SAS",
-        "TORONTO": "TOR",
-        "UTAH": "UTA",
-        "WASHINGTON": "WAS",
-
-        # NHL
-        "ANAHEIM DUCKS": "ANA",
-        "ANAHEIM": "ANA",
-        "ARIZONA COYOTES": "ARI", # Relocated to Utah but keep for history
-        "BOSTON BRUINS": "BOS",
-        "BUFFALO SABRES": "BUF",
-        "BUFFALO": "BUF",
-        "CALGARY FLAMES": "CGY",
-        "CALGARY": "CGY",
-        "CAROLINA HURRICANES": "CAR",
-        "CAROLINA": "CAR",
-        "CHICAGO BLACKHAWKS": "CHI",
-        "COLORADO AVALANCHE": "COL",
-        "COLORADO": "COL",
-        "COLUMBUS BLUE JACKETS": "CBJ",
-        "COLUMBUS": "CBJ",
-        "DALLAS STARS": "DAL",
-        "DETROIT RED WINGS": "DET",
-        "EDMONTON OILERS": "EDM",
-        "EDMONTON": "EDM",
-        "FLORIDA PANTHERS": "FLA",
-        "FLORIDA": "FLA",
-        "LOS ANGELES KINGS": "LAK",
-        "MINNESOTA WILD": "MIN",
-        "MONTREAL CANADIENS": "MTL",
-        "MONTREAL": "MTL",
-        "NASHVILLE PREDATORS": "NSH",
-        "NASHVILLE": "NSH",
-        "NEW JERSEY DEVILS": "NJ",
-        "NEW JERSEY": "NJ",
-        "NEW YORK ISLANDERS": "NYI",
-        "NEW YORK RANGERS": "NYR",
-        "OTTAWA SENATORS": "OTT",
-        "OTTAWA": "OTT",
-        "PHILADELPHIA FLYERS": "PHI",
-        "PITTSBURGH PENGUINS": "PIT",
-        "PITTSBURGH": "PIT",
-        "SAN JOSE SHARKS": "SJS",
-        "SAN JOSE": "SJS",
-        "SEATTLE KRAKEN": "SEA",
-        "SEATTLE": "SEA",
-        "ST. LOUIS BLUES": "STL",
-        "ST. LOUIS": "STL",
-        "TAMPA BAY LIGHTNING": "TBL",
-        "TAMPA BAY": "TBL",
-        "TORONTO MAPLE LEAFS": "TOR",
-        "UTAH HOCKEY CLUB": "UTA",
-        "VANCOUVER CANUCKS": "VAN",
-        "VANCOUVER": "VAN",
-        "VEGAS GOLDEN KNIGHTS": "VGK",
-        "VEGAS": "VGK",
-        "WASHINGTON CAPITALS": "WAS",
-        "WINNIPEG JETS": "WPG",
-        "WINNIPEG": "WPG",
-
-        # NFL
-        "ARIZONA CARDINALS": "ARI",
-        "ATLANTA FALCONS": "ATL",
-        "BALTIMORE RAVENS": "BAL",
-        "BALTIMORE": "BAL",
-        "BUFFALO BILLS": "BUF",
-        "CAROLINA PANTHERS": "CAR",
-        "CINCINNATI BENGALS": "CIN",
-        "CINCINNATI": "CIN",
-        "CLEVELAND BROWNS": "CLE",
-        "DALLAS COWBOYS": "DAL",
-        "DENVER BRONCOS": "DEN",
-        "DETROIT LIONS": "DET",
-        "GREEN BAY PACKERS": "GB",
-        "GREEN BAY": "GB",
-        "HOUSTON TEXANS": "HOU",
-        "INDIANAPOLIS COLTS": "IND",
-        "INDIANAPOLIS": "IND",
-        "JACKSONVILLE JAGUARS": "JAX",
-        "JACKSONVILLE": "JAX",
-        "KANSAS CITY CHIEFS": "KC",
-        "KANSAS CITY": "KC",
-        "LAS VEGAS RAIDERS": "LV",
-        "LAS VEGAS": "LV",
-        "LOS ANGELES CHARGERS": "LAC",
-        "LOS ANGELES RAMS": "LAR",
-        "MIAMI DOLPHINS": "MIA",
-        "MINNESOTA VIKINGS": "MIN",
-        "NEW ENGLAND PATRIOTS": "NE",
-        "NEW ENGLAND": "NE",
-        "NEW ORLEANS SAINTS": "NO",
-        "NEW YORK GIANTS": "NYG",
-        "NEW YORK JETS": "NYJ",
-        "PHILADELPHIA EAGLES": "PHI",
-        "PITTSBURGH STEELERS": "PIT",
-        "SAN FRANCISCO 49ERS": "SF",
-        "SAN FRANCISCO": "SF",
-        "SEATTLE SEAHAWKS": "SEA",
-        "TAMPA BAY BUCCANEERS": "TB",
-        "TENNESSEE TITANS": "TEN",
-        "TENNESSEE": "TEN",
-        "WASHINGTON COMMANDERS": "WAS",
-
-        # Nicknames / Short
-        "THUNDER": "OKC",
-        "NUGGETS": "DEN",
-        "WARRIORS": "GSW",
-        "LAKERS": "LAL",
-        "CLIPPERS": "LAC",
-        "CELTICS": "BOS",
-        "KNICKS": "NYK",
-        "NETS": "BKN",
-        "RAPTORS": "TOR",
-        "76ERS": "PHI",
-        "PHI ERS": "PHI",
-        "SIXERS": "PHI",
-        "HEAT": "MIA",
-        "MAGIC": "ORL",
-        "HAWKS": "ATL",
-        "HORNETS": "CHA",
-        "WIZARDS": "WAS",
-        "CAVALIERS": "CLE",
-        "CAVS": "CLE",
-        "PISTONS": "DET",
-        "PACERS": "IND",
-        "BULLS": "CHI",
-        "BUCKS": "MIL",
-        "TIMBERWOLVES": "MIN",
-        "WOLVES": "MIN",
-        "JAZZ": "UTA",
-        "TRAIL BLAZERS": "POR",
-        "BLAZERS": "POR",
-        "KINGS": "SAC",
-        "SUNS": "PHX",
-        "MAVERICKS": "DAL",
-        "MAVS": "DAL",
-        "ROCKETS": "HOU",
-        "GRIZZLIES": "MEM",
-        "PELICANS": "NOP",
-        "PELS": "NOP",
-        "SPURS": "SAS",
-
-        # NHL Shorts
-        "BRUINS": "BOS",
-        "SABRES": "BUF",
-        "RED WINGS": "DET",
-        "FLAMES": "CGY",
-        "HURRICANES": "CAR",
-        "BLACKHAWKS": "CHI",
-        "AVALANCHE": "COL",
-        "BLUE JACKETS": "CBJ",
-        "STARS": "DAL",
-        "OILERS": "EDM",
-        "PANTHERS": "FLA",
-        "WILD": "MIN",
-        "CANADIENS": "MTL",
-        "PREDATORS": "NSH",
-        "DEVILS": "NJ",
-        "ISLANDERS": "NYI",
-        "RANGERS": "NYR",
-        "SENATORS": "OTT",
-        "FLYERS": "PHI",
-        "PENGUINS": "PIT",
-        "SHARKS": "SJS",
-        "KRAKEN": "SEA",
-        "BLUES": "STL",
-        "LIGHTNING": "TBL",
-        "MAPLE LEAFS": "TOR",
-        "CANUCKS": "VAN",
-        "GOLDEN KNIGHTS": "VGK",
-        "OCAPITALS": "WAS",
-        "CAPITALS": "WAS",
-        "JETS": "WPG",
-
-        # NFL Shorts
-        "CARDINALS": "ARI",
-        "FALCONS": "ATL",
-        "RAVENS": "BAL",
-        "BILLS": "BUF",
-        "BENGALS": "CIN",
-        "BROWNS": "CLE",
-        "COWBOYS": "DAL",
-        "BRONCOS": "DEN",
-        "LIONS": "DET",
-        "PACKERS": "GB",
-        "TEXANS": "HOU",
-        "COLTS": "IND",
-        "JAGUARS": "JAX",
-        "CHIEFS": "KC",
-        "RAIDERS": "LV",
-        "CHARGERS": "LAC",
-        "RAMS": "LAR",
-        "DOLPHINS": "MIA",
-        "VIKINGS": "MIN",
-        "PATRIOTS": "NE",
-        "SAINTS": "NO",
-        "GIANTS": "NYG",
-        "EAGLES": "PHI",
-        "STEELERS": "PIT",
-        "49ERS": "SF",
-        "SEAHAWKS": "SEA",
-        "BUCCANEERS": "TB",
-        "TITANS": "TEN",
-        "COMMANDERS": "WAS",
 
-        # NBA Full Names
-        "OKLAHOMA CITY THUNDER": "OKC",
-        "OKC THUNDER": "OKC",
-        "OKLAHOMA CITY": "OKC",
-        "DENVER NUGGETS": "DEN",
-        "GOLDEN STATE WARRIORS": "GSW",
-        "LOS ANGELES LAKERS": "LAL",
-        "L.A. LAKERS": "LAL",
-        "LOS ANGELES CLIPPERS": "LAC",
-        "L.A. CLIPPERS": "LAC",
-        "BOSTON CELTICS": "BOS",
-        "NEW YORK KNICKS": "NYK",
-        "NY KNICKS": "NYK",
-        "BROOKLYN NETS": "BKN",
-        "TORONTO RAPTORS": "TOR",
-        "PHILADELPHIA 76ERS": "PHI",
-        "MIAMI HEAT": "MIA",
-        "ORLANDO MAGIC": "ORL",
-        "ATLANTA HAWKS": "ATL",
-        "CHARLOTTE HORNETS": "CHA",
-        "WASHINGTON WIZARDS": "WAS",
-        "CLEVELAND CAVALIERS": "CLE",
-        "DETROIT PISTONS": "DET",
-        "INDIANA PACERS": "IND",
-        "CHICAGO BULLS": "CHI",
-        "MILWAUKEE BUCKS": "MIL",
-        "MINNESOTA TIMBERWOLVES": "MIN",
-        "UTAH JAZZ": "UTA",
-        "PORTLAND TRAIL BLAZERS": "POR",
-        "SACRAMENTO KINGS": "SAC",
-        "PHOENIX SUNS": "PHX",
-        "DALLAS MAVERICKS": "DAL",
-        "HOUSTON ROCKETS": "HOU",
-        "MEMPHIS GRIZZLIES": "MEM",
-        "NEW ORLEANS PELICANS": "NOP",
-        "SAN ANTONIO SPURS": "SAS",
-    }
-    
-    # Check exact match
-    if name in mappings:
-        return mappings[name]
-    if canonical_name in mappings:
-        return mappings[canonical_name]
-        
-    # Check partials
-    for rich_name, code in mappings.items():
-        if rich_name in name:
-            return code
-        if canonical_name and rich_name in canonical_name:
+    league_mappings = _MAPPINGS_BY_LEAGUE.get(league)
+    if league_mappings is not None:
+        code = _lookup_code(league_mappings, _AC_BY_LEAGUE.get(league), name, canonical_name)
+        if code is not None:
             return code
-            
+        # A miss in a known league must not borrow another league's code
+        # ("New York" in an NHL row is not the Knicks), so skip the union
+        # and hand back the cleaned name below.
+        code = None
+    else:
+        # Union of all leagues for callers without league context
+        code = _lookup_code(_MAPPINGS, _AC, name, canonical_name)
+    if code is not None:
+        return code
+
     # Fallback: Use first 3 letters? No, dangerous.
     # Return cleaned name
     return canonical_name or name
 
-def normalize_event(event_str):
+def normalize_team_any(name):
+    """Legacy entry point for callers with no league context."""
+    return normalize_team(name)
+
+@lru_cache(maxsize=4096)
+def normalize_event(event_str, league=None):
     """
     Attempts to create a canonical event string.
     Inputs like: "OKC Thunder vs DEN Nuggets"
@@ -357,8 +465,8 @@ def normalize_event(event_str):
         return event_str
         
     if len(parts) == 2:
-        t1 = normalize_team(parts[0])
-        t2 = normalize_team(parts[1])
+        t1 = normalize_team(parts[0], league)
+        t2 = normalize_team(parts[1], league)
         # Sort them to ensure A vs B == B vs A equality
         teams = sorted([t1, t2])
         return f"{teams[0]} vs {teams[1]}"
@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from .runner import print_summary, run_fetch
@@ -14,6 +15,35 @@ from .utils import utc_date_str
 from .filters import filter_markets_by_category
 
 
+@lru_cache(maxsize=1)
+def _fetch_tags() -> list:
+    """
+    Fetch Gamma tags once per process; the interactive picker and the
+    --category resolver share the result instead of each opening their own
+    rate-limited client.
+    """
+    from .gamma import GammaClient
+    from .utils import RateLimiter
+
+    # Initialize rate limiter with 2 requests per second
+    with GammaClient(RateLimiter(2)) as gamma:
+        return gamma.fetch_tags()
+
+
+@lru_cache(maxsize=1)
+def _tag_index() -> dict:
+    """
+    Lowercased label/slug -> tag lookup built once over the cached tag list;
+    earlier tags win ties, matching the old first-match scan.
+    """
+    index = {}
+    for tag in _fetch_tags():
+        for key in ((tag.get("label") or "").lower(), (tag.get("slug") or "").lower()):
+            if key:
+                index.setdefault(key, tag)
+    return index
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -155,16 +185,10 @@ def main() -> int:
         try:
             if args.interactive:
                 print("Fetching available categories...")
-                # We need a temporary Gamma client to fetch tags
-                from .gamma import GammaClient
-                from .utils import RateLimiter
-                
                 # Quick fetch tags
                 try:
-                    # Initialize rate limiter with 2 requests per second
-                    with GammaClient(RateLimiter(2)) as gamma:
-                        tags = gamma.fetch_tags()
-                        
+                    tags = _fetch_tags()
+
                     # Filter for useful tags (e.g. valid slug)
                     valid_tags = [t for t in tags if t.get("slug")]
                     # Sort by label or slug
@@ -203,26 +227,12 @@ def main() -> int:
             if args.category and not args.interactive:
                 # Try to resolve category name to tag_id for server-side filtering
                 try:
-                    from .gamma import GammaClient
-                    from .utils import RateLimiter
-                    
                     print(f"Resolving category '{args.category}' to tag ID...")
-                    # Initialize rate limiter with 2 requests per second
-                    with GammaClient(RateLimiter(2)) as gamma:
-                        tags = gamma.fetch_tags()
-                        
-                    # Find matching tag
-                    match = None
-                    search_term = args.category.lower()
-                    
-                    for tag in tags:
-                        label = (tag.get("label") or "").lower()
-                        slug = (tag.get("slug") or "").lower()
-                        
-                        if search_term == label or search_term == slug:
-                            match = tag
-                            break
-                    
+
+                    # Find matching tag: one dict hit against the prebuilt
+                    # label/slug index instead of a scan over every tag
+                    match = _tag_index().get(args.category.lower())
+
                     if match:
                         tag_id = str(match.get("id"))
                         print(f"Resolved '{args.category}' to Tag ID: {tag_id} ({match.get('label')})")
@@ -4,16 +4,25 @@ CLOB API client for fetching Polymarket prices.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Any
 
 import httpx
 
+try:
+    # HTTP/2 needs the optional h2 package; without it the clients stay on
+    # HTTP/1.1
+    import h2  # noqa: F401
+    HAVE_HTTP2 = True
+except ImportError:
+    HAVE_HTTP2 = False
+
 from .models import PriceResult, TokenOutcome
-from .utils import RateLimiter, chunk_list, parse_decimal, utc_now_iso
+from .utils import RateLimiter, SlidingWindowLimiter, chunk_list, parse_decimal, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +33,9 @@ DEFAULT_TIMEOUT_CONNECT = 10.0
 DEFAULT_TIMEOUT_READ = 30.0
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0
+DEFAULT_CACHE_TTL_SEC = 10.0
+DEFAULT_CACHE_BUCKET_SEC = 10.0
+CACHE_MAX_ENTRIES = 100_000
 
 
 class ClobClient:
@@ -33,21 +45,70 @@ class ClobClient:
 
     def __init__(
         self,
-        rate_limiter: RateLimiter | None = None,
+        rate_limiter: RateLimiter | SlidingWindowLimiter | None = None,
         timeout_connect: float = DEFAULT_TIMEOUT_CONNECT,
         timeout_read: float = DEFAULT_TIMEOUT_READ,
+        cache_ttl_sec: float = DEFAULT_CACHE_TTL_SEC,
+        cache_bucket_sec: float = DEFAULT_CACHE_BUCKET_SEC,
     ):
-        self.rate_limiter = rate_limiter or RateLimiter(requests_per_second=1.0)
+        # Sliding window rather than the token bucket: the batch fan-out
+        # retries after 429s, where boundary bursts matter most
+        self.rate_limiter = rate_limiter or SlidingWindowLimiter(max_requests=1.0)
         self.timeout = httpx.Timeout(
             connect=timeout_connect, read=timeout_read, write=10.0, pool=10.0
         )
+        # Short-TTL LRU of (time bucket, token_id) -> price sides, so
+        # back-to-back fetch_all_prices calls over overlapping token sets
+        # skip the network for prices fetched moments ago. Keys carry the
+        # wall clock rounded down to cache_bucket_sec, so every caller
+        # within the same bucket converges on one snapshot of each token
+        # rather than keying off its exact request time. TTL <= 0
+        # disables caching; bucket <= 0 disables just the rounding.
+        self.cache_ttl_sec = cache_ttl_sec
+        self.cache_bucket_sec = cache_bucket_sec
+        self._price_cache: OrderedDict[
+            tuple[float, str], tuple[float, dict[str, str]]
+        ] = OrderedDict()
+
+    def _cache_key(self, token_id: str) -> tuple[float, str]:
+        """Cache key for a token within the current time bucket."""
+        if self.cache_bucket_sec <= 0:
+            return (0.0, token_id)
+        bucket_ts = int(time.time() // self.cache_bucket_sec) * self.cache_bucket_sec
+        return (bucket_ts, token_id)
+
+    def _cache_get(self, token_id: str) -> dict[str, str] | None:
+        """Return cached sides for a token if still fresh, else None."""
+        key = self._cache_key(token_id)
+        entry = self._price_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, sides = entry
+        if time.monotonic() - stored_at > self.cache_ttl_sec:
+            del self._price_cache[key]
+            return None
+        self._price_cache.move_to_end(key)
+        return sides
+
+    def _cache_put(self, token_id: str, sides: dict[str, str]) -> None:
+        """Store freshly fetched sides, evicting the oldest entry when full."""
+        key = self._cache_key(token_id)
+        self._price_cache[key] = (time.monotonic(), sides)
+        self._price_cache.move_to_end(key)
+        if len(self._price_cache) > CACHE_MAX_ENTRIES:
+            self._price_cache.popitem(last=False)
+
+    def close(self) -> None:
+        """No-op: the pooled client lives inside fetch_all_prices now."""
 
-    def _create_client(self) -> httpx.Client:
-        """Create a new HTTP client (for thread safety)."""
-        return httpx.Client(base_url=CLOB_BASE_URL, timeout=self.timeout)
+    def __enter__(self) -> "ClobClient":
+        return self
 
-    def _request_with_retry(
-        self, client: httpx.Client, request_items: list[dict[str, str]], batch_num: int
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def _request_with_retry(
+        self, client: httpx.AsyncClient, request_items: list[dict[str, str]], batch_num: int
     ) -> tuple[dict[str, Any], int]:
         """
         Make a POST /prices request with retry logic and rate limiting.
@@ -57,11 +118,11 @@ class ClobClient:
         last_error: Exception | None = None
         
         for attempt in range(MAX_RETRIES):
-            self.rate_limiter.wait()
+            await asyncio.sleep(self.rate_limiter.reserve())
             start_time = time.monotonic()
             
             try:
-                response = client.post("/prices", json=request_items)
+                response = await client.post("/prices", json=request_items)
                 latency_ms = (time.monotonic() - start_time) * 1000
                 
                 logger.info(
@@ -78,7 +139,7 @@ class ClobClient:
                 if response.status_code >= 500:
                     backoff = INITIAL_BACKOFF * (2 ** attempt)
                     logger.warning(f"Server error {response.status_code}, backing off {backoff}s")
-                    time.sleep(backoff)
+                    await asyncio.sleep(backoff)
                     continue
 
                 if response.status_code == 200:
@@ -91,20 +152,41 @@ class ClobClient:
                 last_error = e
                 backoff = INITIAL_BACKOFF * (2 ** attempt)
                 logger.warning(f"Request error: {e}, backing off {backoff}s")
-                time.sleep(backoff)
+                await asyncio.sleep(backoff)
                 continue
 
         logger.error(f"Max retries exceeded for batch {batch_num}: {last_error}")
         return {}, 0
 
-    def _fetch_batch(
-        self, batch_num: int, request_items: list[dict[str, str]]
+    async def _fetch_batch(
+        self,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        batch_num: int,
+        request_items: list[dict[str, str]],
     ) -> tuple[int, dict[str, Any], int]:
         """Fetch a single batch, returning (batch_num, response_data, status)."""
-        with self._create_client() as client:
-            data, status = self._request_with_retry(client, request_items, batch_num)
+        async with sem:
+            data, status = await self._request_with_retry(client, request_items, batch_num)
             return batch_num, data, status
 
+    async def _fetch_all_async(
+        self, batches: list[list[dict[str, str]]], concurrency: int
+    ) -> list[tuple[int, dict[str, Any], int] | BaseException]:
+        """Run all batches over one pooled AsyncClient, bounded by a semaphore."""
+        sem = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+        async with httpx.AsyncClient(
+            base_url=CLOB_BASE_URL, timeout=self.timeout, limits=limits,
+            http2=HAVE_HTTP2,
+        ) as client:
+            return await asyncio.gather(
+                *(self._fetch_batch(client, sem, i, batch) for i, batch in enumerate(batches)),
+                return_exceptions=True,
+            )
+
     def fetch_all_prices(
         self,
         token_outcomes: list[TokenOutcome],
@@ -123,61 +205,70 @@ class ClobClient:
         if snapshot_ts is None:
             snapshot_ts = utc_now_iso()
 
-        # Build request items: one item per token requesting both sides
-        # We request BUY only since response may include both sides
+        prices_by_token: dict[str, dict[str, str]] = {}  # token_id -> {BUY: price, SELL: price}
+        cache_hits = 0
+
+        # One item per token: the /prices response keys on token_id and
+        # carries both sides regardless of the side requested, so the old
+        # BUY+SELL pair per token doubled batch count for nothing.
+        # Tokens priced within the cache TTL are served from memory and
+        # never queued at all.
         request_items: list[dict[str, str]] = []
         for token in token_outcomes:
+            if self.cache_ttl_sec > 0:
+                cached = self._cache_get(token.token_id)
+                if cached is not None:
+                    prices_by_token[token.token_id] = dict(cached)
+                    cache_hits += 1
+                    continue
             request_items.append({"token_id": token.token_id, "side": "BUY"})
-            request_items.append({"token_id": token.token_id, "side": "SELL"})
 
         # Create token lookup for easy access
         token_lookup = {t.token_id: t for t in token_outcomes}
 
         # Chunk into batches
         batches = list(chunk_list(request_items, batch_size))
-        logger.info(f"Fetching prices for {len(token_outcomes)} tokens in {len(batches)} batches")
+        logger.info(
+            f"Fetching prices for {len(request_items)} of {len(token_outcomes)} tokens "
+            f"in {len(batches)} batches ({cache_hits} cache hits)"
+        )
 
         all_raw_responses: list[dict[str, Any]] = []
-        prices_by_token: dict[str, dict[str, str]] = {}  # token_id -> {BUY: price, SELL: price}
         api_error_tokens: set[str] = set()
 
-        # Execute batches concurrently
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = {
-                executor.submit(self._fetch_batch, i, batch): i
-                for i, batch in enumerate(batches)
-            }
-
-            for future in as_completed(futures):
-                batch_num = futures[future]
-                try:
-                    _, data, status = future.result()
-                    all_raw_responses.append({
-                        "batch_num": batch_num,
-                        "status": status,
-                        "data": data,
-                    })
-
-                    if status == 200 and data:
-                        # Response format: { token_id: { "BUY": "price", "SELL": "price" } }
-                        for token_id, sides in data.items():
-                            if isinstance(sides, dict):
-                                if token_id not in prices_by_token:
-                                    prices_by_token[token_id] = {}
-                                for side, price in sides.items():
-                                    if side in ("BUY", "SELL"):
-                                        prices_by_token[token_id][side] = str(price)
-                    elif status != 200:
-                        # Mark all tokens in this batch as having API errors
-                        batch = batches[batch_num]
-                        for item in batch:
-                            api_error_tokens.add(item["token_id"])
-
-                except Exception as e:
-                    logger.error(f"Batch {batch_num} failed: {e}")
-                    batch = batches[batch_num]
-                    for item in batch:
-                        api_error_tokens.add(item["token_id"])
+        # Execute batches concurrently: pure I/O waiting, so coroutines on
+        # one event loop replace the worker threads
+        outcomes = asyncio.run(self._fetch_all_async(batches, concurrency))
+
+        for batch_num, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Batch {batch_num} failed: {outcome}")
+                for item in batches[batch_num]:
+                    api_error_tokens.add(item["token_id"])
+                continue
+
+            _, data, status = outcome
+            all_raw_responses.append({
+                "batch_num": batch_num,
+                "status": status,
+                "data": data,
+            })
+
+            if status == 200 and data:
+                # Response format: { token_id: { "BUY": "price", "SELL": "price" } }
+                for token_id, sides in data.items():
+                    if isinstance(sides, dict):
+                        if token_id not in prices_by_token:
+                            prices_by_token[token_id] = {}
+                        for side, price in sides.items():
+                            if side in ("BUY", "SELL"):
+                                prices_by_token[token_id][side] = str(price)
+                        if self.cache_ttl_sec > 0 and prices_by_token[token_id]:
+                            self._cache_put(token_id, dict(prices_by_token[token_id]))
+            elif status != 200:
+                # Mark all tokens in this batch as having API errors
+                for item in batches[batch_num]:
+                    api_error_tokens.add(item["token_id"])
 
         # Build PriceResult objects
         results: list[PriceResult] = []
@@ -185,6 +276,7 @@ class ClobClient:
             "tokens_priced_ok": 0,
             "tokens_missing_price": 0,
             "api_errors": 0,
+            "cache_hits": cache_hits,
         }
 
         for token in token_outcomes:
@@ -10,6 +10,14 @@ from typing import Any
 
 import httpx
 
+try:
+    # HTTP/2 needs the optional h2 package; without it the clients stay on
+    # HTTP/1.1
+    import h2  # noqa: F401
+    HAVE_HTTP2 = True
+except ImportError:
+    HAVE_HTTP2 = False
+
 from .utils import RateLimiter, parse_json_string_field
 
 logger = logging.getLogger(__name__)
@@ -38,6 +46,7 @@ class GammaClient:
         self.client = httpx.Client(
             base_url=GAMMA_BASE_URL,
             timeout=httpx.Timeout(connect=timeout_connect, read=timeout_read, write=10.0, pool=10.0),
+            http2=HAVE_HTTP2,
         )
 
     def close(self) -> None:
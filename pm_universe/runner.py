@@ -20,7 +20,7 @@ from .io_store import (
     write_raw_json,
 )
 from .models import MarketRecord, PriceResult, RunManifest, TokenOutcome
-from .utils import RateLimiter, ensure_dirs, safe_json_dumps, utc_date_str, utc_now, utc_now_iso
+from .utils import RateLimiter, SlidingWindowLimiter, ensure_dirs, safe_json_dumps, utc_date_str, utc_now, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +153,7 @@ def run_fetch(
 
     # Setup rate limiters
     gamma_limiter = RateLimiter(requests_per_second=gamma_rate) # Kept requests_per_second for clarity
-    clob_limiter = RateLimiter(requests_per_second=clob_rate) # Kept requests_per_second for clarity
+    clob_limiter = SlidingWindowLimiter(max_requests=clob_rate) # clob_rate requests per 1s window
 
     # Determine filter params
     # "active=true" AND "closed=false" is the best way to get currently tradable markets
@@ -296,14 +296,13 @@ def run_fetch(
     # Step 5: Fetch prices from CLOB
     if all_token_outcomes:
         logger.info(f"Fetching prices for {len(all_token_outcomes)} tokens...")
-        clob = ClobClient(rate_limiter=clob_limiter)
-        
-        price_results, raw_batches, price_stats = clob.fetch_all_prices(
-            all_token_outcomes,
-            concurrency=concurrency,
-            batch_size=batch_size,
-            snapshot_ts=pulled_at,
-        )
+        with ClobClient(rate_limiter=clob_limiter) as clob:
+            price_results, raw_batches, price_stats = clob.fetch_all_prices(
+                all_token_outcomes,
+                concurrency=concurrency,
+                batch_size=batch_size,
+                snapshot_ts=pulled_at,
+            )
 
         # Save raw batch responses
         for batch_response in raw_batches:
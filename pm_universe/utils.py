@@ -96,31 +96,141 @@ def ensure_dirs(base_path: Path, date_str: str) -> dict[str, Path]:
 
 class RateLimiter:
     """
-    Thread-safe rate limiter with configurable requests per second.
-    
+    Thread-safe token-bucket rate limiter.
+
+    The bucket refills continuously at requests_per_second and holds up to
+    `burst` tokens, so after an idle stretch a group of concurrent callers
+    can each take a token at once instead of being serialized one interval
+    apart. Letting the balance go negative encodes queued reservations,
+    which keeps callers evenly paced once the burst is spent.
+
     Usage:
-        limiter = RateLimiter(requests_per_second=2.0)
+        limiter = RateLimiter(requests_per_second=2.0, burst=5)
         limiter.wait()  # blocks until allowed
         # make request
     """
 
-    def __init__(self, requests_per_second: float = 1.0):
-        self.min_interval = 1.0 / requests_per_second
+    def __init__(self, requests_per_second: float = 1.0, burst: float = 1.0):
+        self.rate = requests_per_second
+        self.capacity = max(1.0, burst)
         self._lock = threading.Lock()
-        self._next_allowed = 0.0
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._gate = 0.0  # earliest resume time, set by Retry-After
+
+    def reserve(self) -> float:
+        """
+        Claim the next request slot and return how long the caller must
+        sleep before using it (0.0 when it is already due).
+
+        Splitting the bookkeeping from the sleep keeps the lock short and
+        lets async callers await the delay instead of blocking the loop.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= 1.0
+            delay = 0.0
+            if self._tokens < 0.0:
+                delay = -self._tokens / self.rate
+            if self._gate > now:
+                delay = max(delay, self._gate - now)
+            return delay
 
     def wait(self) -> None:
         """Block until the next request is allowed."""
+        time.sleep(self.reserve())
+
+    def set_wait_until(self, seconds_from_now: float) -> None:
+        """Set minimum wait time (for Retry-After handling)."""
+        with self._lock:
+            new_time = time.monotonic() + seconds_from_now
+            if new_time > self._gate:
+                self._gate = new_time
+            # Drain any saved-up burst: resuming after a 429 should restart
+            # at the paced rate, not with a thundering herd
+            self._tokens = min(self._tokens, 0.0)
+
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe sliding-window rate limiter.
+
+    Counts requests in the current and previous fixed windows and weights
+    the previous one by how far the window has slid, approximating a true
+    rolling count without keeping per-request timestamps. Unlike a fixed
+    window this never admits double the rate across a boundary, and
+    waiters resuming after a 429 are smoothed by the decaying previous
+    count rather than stampeding at once.
+
+    Shares the reserve()/wait()/set_wait_until() interface with
+    RateLimiter, so clients accept either.
+    """
+
+    def __init__(self, max_requests: float, window_sec: float = 1.0):
+        self.max_requests = max_requests
+        self.window_sec = window_sec
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._prev_count = 0.0
+        self._curr_count = 0.0
+        self._future_counts: list[float] = []  # bookings for upcoming windows
+        self._gate = 0.0  # earliest resume time, set by Retry-After
+
+    def _roll(self, now: float) -> float:
+        """Advance window slots to cover `now`; returns elapsed in-window time."""
+        elapsed = now - self._window_start
+        while elapsed >= self.window_sec:
+            self._window_start += self.window_sec
+            elapsed -= self.window_sec
+            self._prev_count = self._curr_count
+            self._curr_count = (
+                self._future_counts.pop(0) if self._future_counts else 0.0
+            )
+        return elapsed
+
+    def reserve(self) -> float:
+        """
+        Claim a request slot and return how long the caller must sleep
+        before using it (0.0 when the window has room).
+
+        Overflowing callers are staggered max_requests per future window,
+        each booked into the window it will actually run in, so a full
+        window drains as an even trickle instead of a thundering herd at
+        the boundary.
+        """
         with self._lock:
             now = time.monotonic()
-            if now < self._next_allowed:
-                sleep_time = self._next_allowed - now
-                time.sleep(sleep_time)
-            self._next_allowed = time.monotonic() + self.min_interval
+            elapsed = self._roll(now)
+            weighted = (
+                self._prev_count * (1.0 - elapsed / self.window_sec) + self._curr_count
+            )
+            if weighted + 1.0 <= self.max_requests:
+                self._curr_count += 1.0
+                delay = 0.0
+            else:
+                queued = sum(self._future_counts)
+                delay = (self.window_sec - elapsed) + (
+                    queued * self.window_sec / self.max_requests
+                )
+                target = int(queued / self.max_requests)
+                while len(self._future_counts) <= target:
+                    self._future_counts.append(0.0)
+                self._future_counts[target] += 1.0
+            if self._gate > now:
+                delay = max(delay, self._gate - now)
+            return delay
+
+    def wait(self) -> None:
+        """Block until the next request is allowed."""
+        time.sleep(self.reserve())
 
     def set_wait_until(self, seconds_from_now: float) -> None:
         """Set minimum wait time (for Retry-After handling)."""
         with self._lock:
             new_time = time.monotonic() + seconds_from_now
-            if new_time > self._next_allowed:
-                self._next_allowed = new_time
+            if new_time > self._gate:
+                self._gate = new_time
@@ -4,9 +4,31 @@ import re
 import os
 from datetime import datetime, timedelta
 
-def parse_pointsbet_json(input_path, output_dir):
+try:
+    import zstandard
+    HAVE_ZSTD = True
+except ImportError:
+    HAVE_ZSTD = False
+
+def _load_scraped(input_path):
+    """
+    Reads the scraper output, preferring the zstd-compressed artifact.
+    When both formats exist the newer one wins: the fetcher falls back to
+    plain JSON when zstandard is missing or POINTSBET_NO_COMPRESS is set,
+    and a leftover .zst must not shadow that fresher file.
+    """
+    zst_path = input_path + '.zst'
+    use_zst = HAVE_ZSTD and os.path.exists(zst_path)
+    if use_zst and os.path.exists(input_path):
+        use_zst = os.path.getmtime(zst_path) >= os.path.getmtime(input_path)
+    if use_zst:
+        with open(zst_path, 'rb') as f:
+            return json.loads(zstandard.ZstdDecompressor().decompress(f.read()))
     with open(input_path, 'r') as f:
-        data = json.load(f)
+        return json.load(f)
+
+def parse_pointsbet_json(input_path, output_dir):
+    data = _load_scraped(input_path)
         
     os.makedirs(output_dir, exist_ok=True)
     
@@ -14,6 +14,7 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 
@@ -129,26 +130,40 @@ def main():
 
     total_start = time.time()
 
-    if not run_command("python -m pm_universe fetch --active --category Sports", "Polymarket Data Fetch"):
-        print(">> Polymarket fetch failed (non-critical).")
+    # Each source is an independent process, so the acquisition phase runs
+    # them concurrently: wall-clock is the slowest source instead of the sum.
+    # Conversion steps stay chained behind the fetch they depend on.
 
-    if not run_command("python fetch_dk_playwright.py", "DraftKings Scraper"):
-        print(">> DraftKings scrape failed.")
-    else:
-        if not run_command("python convert_dk_json_to_csv.py", "DraftKings Conversion"):
-            print(">> DraftKings conversion failed.")
+    def fetch_polymarket():
+        if not run_command("python -m pm_universe fetch --active --category Sports", "Polymarket Data Fetch"):
+            print(">> Polymarket fetch failed (non-critical).")
 
-    if not run_command("python fetch_fanduel.py", "FanDuel Scraper"):
-        print(">> FanDuel step failed (non-critical), continuing...")
+    def fetch_draftkings():
+        if not run_command("python fetch_dk_playwright.py", "DraftKings Scraper"):
+            print(">> DraftKings scrape failed.")
+        else:
+            if not run_command("python convert_dk_json_to_csv.py", "DraftKings Conversion"):
+                print(">> DraftKings conversion failed.")
 
-    if not run_command("python fetch_pointsbet.py", "PointsBet Scraper"):
-        print(">> PointsBet scrape failed (non-critical), continuing...")
-    else:
-        if not run_command("python process_pointsbet_data.py", "PointsBet Processing"):
-            print(">> PointsBet processing failed.")
+    def fetch_fanduel():
+        if not run_command("python fetch_fanduel.py", "FanDuel Scraper"):
+            print(">> FanDuel step failed (non-critical), continuing...")
+
+    def fetch_pointsbet():
+        if not run_command("python fetch_pointsbet.py", "PointsBet Scraper"):
+            print(">> PointsBet scrape failed (non-critical), continuing...")
+        else:
+            if not run_command("python process_pointsbet_data.py", "PointsBet Processing"):
+                print(">> PointsBet processing failed.")
+
+    def fetch_kalshi():
+        if not run_command("python fetch_kalshi.py", "Kalshi Fetch"):
+            print(">> Kalshi fetch failed (non-critical), continuing...")
 
-    if not run_command("python fetch_kalshi.py", "Kalshi Fetch"):
-         print(">> Kalshi fetch failed (non-critical), continuing...")
+    fetchers = [fetch_polymarket, fetch_draftkings, fetch_fanduel, fetch_pointsbet, fetch_kalshi]
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        for future in [executor.submit(fetcher) for fetcher in fetchers]:
+            future.result()
 
     if not run_command("python consolidate_odds.py", "Data Consolidation"):
         print("Pipeline aborted due to Consolidation failure.")
@@ -10,6 +10,12 @@ def prob_to_moneyline(p):
         ml = ((1 - p) / p) * 100
     return int(round(ml))
 
+def decimal_to_moneyline(d):
+    """Converts decimal (European) odds to American Moneyline odds."""
+    if d is None or d <= 1:
+        return None
+    return prob_to_moneyline(1.0 / d)
+
 def moneyline_to_prob(ml):
     """Converts American Moneyline odds to implied probability (0-1)."""
     if ml == 0:
@@ -0,0 +1,77 @@
+"""
+In-memory response cache for Playwright scrapers.
+
+Sibling league pages on the same sportsbook pull identical JS bundles on
+every navigation; caching the public static responses lets later page loads
+(or parallel contexts) serve them locally instead of re-downloading and
+re-transferring the same bytes.
+"""
+
+import re
+import time
+from threading import Lock
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Only static assets are worth keeping; documents and API responses change
+# per navigation and must never be replayed.
+_CACHEABLE_TYPES = {"script", "stylesheet", "font"}
+
+
+class ResponseCache:
+    """Caches 'Cache-Control: public, max-age=...' static assets by URL."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+
+    def store(self, response):
+        """page.on('response') hook: remember cacheable static responses."""
+        try:
+            if response.request.resource_type not in _CACHEABLE_TYPES:
+                return
+            cache_control = response.headers.get("cache-control", "")
+            if "public" not in cache_control:
+                return
+            match = _MAX_AGE_RE.search(cache_control)
+            if not match:
+                return
+            ttl = int(match.group(1))
+            if ttl <= 0:
+                return
+            body = response.body()
+            with self._lock:
+                self._entries[response.url] = (
+                    time.time() + ttl,
+                    response.status,
+                    response.headers.get("content-type", ""),
+                    body,
+                )
+        except Exception:
+            # Caching is best-effort; a failed body read must not kill the scrape
+            pass
+
+    def _lookup(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry[0] < time.time():
+            with self._lock:
+                self._entries.pop(url, None)
+            return None
+        return entry
+
+    def handle(self, route):
+        """
+        Route handler: fulfill GETs from cache when fresh, otherwise let the
+        request through. Must stay single-parameter: Playwright passes
+        (route, request) to any two-parameter handler.
+        """
+        if route.request.method == "GET":
+            hit = self._lookup(route.request.url)
+            if hit is not None:
+                _, status, content_type, body = hit
+                route.fulfill(status=status, content_type=content_type, body=body)
+                return
+        route.continue_()